@@ -0,0 +1,269 @@
+"""
+Athena AI Research System - Shared core for the chat and script entry points
+"""
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+class AthenaCache:
+    """Bounded on-disk LRU cache of model responses keyed by prompt hash
+
+    Entries older than ttl seconds are treated as missing, so answers about
+    recent developments do not outlive their usefulness.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 1000,
+        ttl: Optional[float] = 24 * 60 * 60
+    ):
+        self.max_entries = max_entries
+        self.ttl_ns = int(ttl * 1e9) if ttl else None
+        self.connection = sqlite3.connect(str(path))
+        # Entries of the old table were keyed without the model, so they are dropped
+        self.connection.execute("DROP TABLE IF EXISTS cache")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(k BLOB PRIMARY KEY, v TEXT, created INTEGER, ts INTEGER)"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def _key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, prompt: str) -> Optional[str]:
+        """Return the cached response for a prompt, refreshing its recency"""
+        key = self._key(prompt)
+        row = self.connection.execute("SELECT v, created FROM responses WHERE k = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        now = time.time_ns()
+        if self.ttl_ns is not None and now - row[1] > self.ttl_ns:
+            self.connection.execute("DELETE FROM responses WHERE k = ?", (key,))
+            self.connection.commit()
+            return None
+
+        self.connection.execute("UPDATE responses SET ts = ? WHERE k = ?", (now, key))
+        self.connection.commit()
+        return row[0]
+
+    def put(self, prompt: str, response: str):
+        """Store a response, evicting the least recently used entries past the limit"""
+        now = time.time_ns()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO responses (k, v, created, ts) VALUES (?, ?, ?, ?)",
+            (self._key(prompt), response, now, now)
+        )
+        self.connection.execute(
+            "DELETE FROM responses WHERE k NOT IN (SELECT k FROM responses ORDER BY ts DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+        self.connection.commit()
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+async def cached_generate(
+    cache: Optional[AthenaCache],
+    model,
+    contents: Union[str, List[Dict]],
+    on_text: Optional[Callable[[str], None]] = None
+) -> str:
+    """Generate a response for a prompt or chat turns, reusing a cached answer when one exists
+
+    When on_text is given the response is streamed and each chunk is passed to it
+    as it arrives. Without a cache every call goes to the model.
+    """
+    # The cache is shared by every entry point, so the model and its system
+    # instruction are part of the key alongside the prompt or chat turns
+    key = json.dumps([
+        getattr(model, 'model_name', ""),
+        str(getattr(model, '_system_instruction', None) or ""),
+        contents
+    ])
+
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        if on_text:
+            on_text(cached)
+        return cached
+
+    if on_text:
+        chunks = []
+        response = await model.generate_content_async(contents, stream=True)
+        async for chunk in response:
+            chunks.append(chunk.text)
+            on_text(chunk.text)
+        text = "".join(chunks)
+    else:
+        response = await model.generate_content_async(contents)
+        text = response.text
+
+    if cache:
+        cache.put(key, text)
+    return text
+
+def report_filename(topic: str) -> str:
+    """Name a research report so runs started in the same second do not collide"""
+    slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')[:40] or "report"
+    return f"research_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{slug}_{uuid.uuid4().hex[:6]}.md"
+
+def dedupe_sources(sources: List[Dict]) -> List[Dict]:
+    """Drop search results that repeat a URL or the start of another result's content"""
+    seen_urls = set()
+    seen_content = set()
+    unique = []
+
+    for source in sources:
+        url = source.get('url', '').split('#')[0].rstrip('/')
+        content_key = hash(source.get('content', '')[:200])
+        if (url and url in seen_urls) or content_key in seen_content:
+            continue
+        if url:
+            seen_urls.add(url)
+        seen_content.add(content_key)
+        unique.append(source)
+
+    return unique
+
+async def run_research(
+    topic: str,
+    model,
+    search_client,
+    context: str = "",
+    max_sources: int = 8,
+    results_per_query: int = 3,
+    cache: Optional[AthenaCache] = None,
+    verbose: bool = False
+) -> Dict:
+    """Plan, search and analyze a topic, returning the plan, analysis and sources
+
+    Progress is printed as the steps run; verbose also prints the plan and the
+    search queries.
+    """
+    # Conversation context is optional and always comes after the static instructions
+    plan_context = f"""
+        Based on our conversation history:
+        {context}
+        """ if context else ""
+    analysis_context = f"""
+        Conversation Context:
+        {context}
+        """ if context else ""
+    relevance_note = "\n        - Make it relevant to our conversation context" if context else ""
+
+    # Step 1: Generate research plan
+    print("[1/4] Generating research plan...")
+    plan_prompt = f"""
+        Create a focused research plan.
+
+        Generate:
+        1. 3 specific research questions
+        2. Key areas to investigate
+        3. Search strategy
+
+        Keep it concise and actionable.
+
+        Research Topic: {topic}
+        {plan_context}"""
+
+    plan_task = asyncio.create_task(cached_generate(cache, model, plan_prompt))
+
+    # The searches do not depend on the plan, so start them while it is generated
+    search_queries = [
+        f"{topic} latest research 2024",
+        f"{topic} current applications",
+        f"{topic} future trends"
+    ]
+    # The Tavily client is synchronous, so each search runs in a worker thread
+    search_task = asyncio.gather(*[
+        asyncio.to_thread(search_client.search, query, max_results=results_per_query)
+        for query in search_queries
+    ], return_exceptions=True)
+
+    try:
+        plan = await plan_task
+    except BaseException:
+        # Do not leave the searches running with nobody to collect their results
+        search_task.cancel()
+        await asyncio.gather(search_task, return_exceptions=True)
+        raise
+    print("[OK] Research plan generated")
+
+    if verbose:
+        print("\n" + "=" * 40)
+        print("[Plan] RESEARCH PLAN")
+        print("=" * 40)
+        print(plan)
+        print("=" * 40)
+
+    # Step 2: Collect search results
+    print("[2/4] Searching for information...")
+    if verbose:
+        print(f"[Search] Using {len(search_queries)} search queries:")
+        for i, query in enumerate(search_queries, 1):
+            print(f"  {i}. \"{query}\"")
+
+    search_results = await search_task
+
+    all_sources = []
+    for query, results in zip(search_queries, search_results):
+        if isinstance(results, Exception):
+            print(f"[Warning] Search error for '{query}': {results}")
+        else:
+            all_sources.extend(results['results'])
+
+    # Overlapping queries often return the same pages
+    all_sources = dedupe_sources(all_sources)
+    print(f"[OK] Found {len(all_sources)} sources")
+
+    # Step 3: AI analysis
+    print("[3/4] AI analysis and synthesis...")
+    sources = all_sources[:max_sources]
+    sources_text = "".join(
+        f"\nSource {i}: {source['title']}\n{source['content'][:400]}...\n"
+        for i, source in enumerate(sources, 1)
+    )
+
+    analysis_prompt = f"""
+        Create a comprehensive research report with:
+
+        ## Executive Summary
+        ## Key Findings
+        ## Current Applications
+        ## Future Implications
+        ## Recommendations
+
+        IMPORTANT:
+        - Cite sources using numbers like (Source 1), (Source 2), etc.
+        - Include specific facts and data from the sources
+        - Reference the source numbers when making claims{relevance_note}
+
+        Research Topic: {topic}
+
+        Research Plan:
+        {plan}
+        {analysis_context}
+        Sources Found:
+        {sources_text}
+        """
+
+    analysis_response = await model.generate_content_async(analysis_prompt)
+
+    return {
+        'plan': plan,
+        'analysis': analysis_response.text,
+        'sources': sources,
+        'sources_count': len(all_sources)
+    }
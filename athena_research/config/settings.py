@@ -41,6 +41,9 @@ class AthenaSettings(BaseSettings):
     default_temperature: float = float(os.getenv("DEFAULT_TEMPERATURE", "0.3"))
     max_tokens: int = int(os.getenv("MAX_TOKENS", "4000"))
 
+    # Workflow
+    max_parallel_sections: int = int(os.getenv("MAX_PARALLEL_SECTIONS", "4"))
+
     class Config:
         env_file = ".env"
 
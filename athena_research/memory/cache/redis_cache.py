@@ -1,11 +1,11 @@
 from typing import Any, Dict, List, Optional
 import asyncio
-import json
 import time
 from datetime import datetime, timedelta
 import redis.asyncio as redis
 from ..base_memory import BaseMemoryStore, MemoryItem, MemoryQuery, MemoryResult
 from ...config import settings
+from .. import json_codec
 
 class RedisCacheStore(BaseMemoryStore):
     def __init__(self, redis_url: str = None, prefix: str = "athena:memory:"):
@@ -40,7 +40,7 @@ class RedisCacheStore(BaseMemoryStore):
 
             # Store the item
             await self.client.hset(key, mapping={
-                "data": json.dumps(value),
+                "data": json_codec.dumps(value),
                 "content": item.content,  # Store separately for text search
                 "memory_type": item.memory_type,
                 "timestamp": item.timestamp.isoformat()
@@ -91,7 +91,7 @@ class RedisCacheStore(BaseMemoryStore):
                     continue
 
                 # Parse the stored data
-                data = json.loads(item_data.get("data", "{}"))
+                data = json_codec.loads(item_data.get("data", "{}"))
 
                 # Simple text matching for query
                 content = data.get("content", "").lower()
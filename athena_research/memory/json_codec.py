@@ -0,0 +1,55 @@
+from typing import Any, Union
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types orjson serializes natively, and reject the rest like orjson does"""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _key(key: Any) -> str:
+    """Stringify a dict key the way orjson's OPT_NON_STR_KEYS does"""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    if isinstance(key, enum.Enum):
+        return _key(key.value)
+    if isinstance(key, (datetime.datetime, datetime.date, datetime.time, uuid.UUID)):
+        return _default(key)
+    raise TypeError(f"Dict key must be str, not {type(key).__name__}")
+
+def _normalize_keys(value: Any) -> Any:
+    """Copy nested dicts with every key already stringified"""
+    if isinstance(value, dict):
+        return {_key(k): _normalize_keys(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_keys(v) for v in value]
+    return value
+
+def dumps(value: Any) -> str:
+    """Serialize a value to JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(_normalize_keys(value), default=_default, separators=(",", ":"), ensure_ascii=False)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -124,6 +124,37 @@ class MemoryManager:
         success = await self._store_item(item)
         return item_id if success else None
 
+    async def store_plan_template(self, topic: str, plan_data: Dict[str, Any]) -> str:
+        """Store a plan keyed by its topic so similar topics can reuse its structure"""
+        item_id = str(uuid.uuid4())
+
+        item = MemoryItem(
+            id=item_id,
+            content=topic,
+            metadata={"plan_data": plan_data},
+            timestamp=datetime.now(),
+            memory_type="plan_template"
+        )
+
+        success = await self._store_item(item)
+        return item_id if success else None
+
+    async def lookup_plan_template(
+        self,
+        topic: str,
+        similarity_threshold: float = 0.85
+    ) -> Optional[Dict[str, Any]]:
+        """Find the stored plan whose topic is most similar to the given topic"""
+        memory_query = MemoryQuery(
+            query=topic,
+            memory_types=["plan_template"],
+            limit=1,
+            similarity_threshold=similarity_threshold
+        )
+
+        templates = await self._retrieve_items(memory_query)
+        return templates[0].metadata.get("plan_data") if templates else None
+
     async def retrieve_facts(
         self,
         query: str,
@@ -1,13 +1,34 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
+import os
 import uuid
 import time
 from datetime import datetime
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
+from .onnx_encoder import OnnxSentenceEncoder
 from ..base_memory import BaseMemoryStore, MemoryItem, MemoryQuery, MemoryResult
 from ...config import settings
+from .. import json_codec
+
+# Longest input the embedding model sees; longer contents are split into
+# overlapping windows stored as sub-items of the original item
+MAX_SEQ_LENGTH = 256
+CHUNK_OVERLAP = 32
+
+# Chunk hits fetched per requested item, since several hits can belong to
+# one item and some fall below the similarity threshold
+RETRIEVE_OVERFETCH = 3
+
+class _EncoderEmbeddingFunction:
+    """Chroma embedding function backed by the store's own encoder"""
+
+    def __init__(self, encode):
+        self._encode = encode
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return self._encode(list(input))
 
 class ChromaMemoryStore(BaseMemoryStore):
     def __init__(self, persist_directory: str = None, collection_name: str = "athena_memory"):
@@ -25,50 +46,83 @@ class ChromaMemoryStore(BaseMemoryStore):
             )
         )
 
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Initialize embedding model; the collection calls it through its
+        # embedding function, so documents and queries are embedded by Chroma
+        try:
+            # ONNX Runtime export of the model, cached next to the Chroma data
+            self.embedding_model = OnnxSentenceEncoder(
+                'sentence-transformers/all-MiniLM-L6-v2',
+                cache_dir=os.path.join(self.persist_directory, "onnx"),
+                max_seq_length=MAX_SEQ_LENGTH
+            )
+        except Exception as e:
+            print(f"ONNX encoder unavailable, falling back to PyTorch: {e}")
+            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.embedding_model.max_seq_length = MAX_SEQ_LENGTH
+        self.embedding_function = _EncoderEmbeddingFunction(self._encode)
 
         # Get or create collection
-        try:
-            self.collection = self.client.get_collection(name=self.collection_name)
-        except:
-            self.collection = self.client.create_collection(
-                name=self.collection_name,
-                metadata={"description": "Athena research memory store"}
+        self.collection = self._get_or_create_collection()
+
+    def _get_or_create_collection(self):
+        """Open the memory collection, creating it on first use"""
+        collection = self.client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={
+                "description": "Athena research memory store",
+                # Embeddings are L2-normalized, so inner product equals cosine
+                # similarity and Chroma's distance is 1 - cosine
+                "hnsw:space": "ip"
+            },
+            embedding_function=self.embedding_function
+        )
+
+        # The metadata only applies on creation; older stores keep their space
+        self.distance_space = (collection.metadata or {}).get("hnsw:space", "l2")
+        if self.distance_space != "ip":
+            print(
+                f"Warning: collection '{self.collection_name}' uses the '{self.distance_space}' "
+                "distance; similarities are converted for it. Clear the store to switch to 'ip'."
             )
 
+        return collection
+
+    def _similarity(self, distance: float) -> float:
+        """Convert a Chroma distance between normalized embeddings to cosine similarity"""
+        if self.distance_space == "l2":
+            # Chroma's l2 is the squared distance, 2 - 2 * cosine for unit vectors
+            return 1.0 - distance / 2.0
+        return 1.0 - distance
+
     async def store(self, item: MemoryItem) -> bool:
         """Store a memory item with vector embedding"""
-        try:
-            # Generate embedding for the content
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None,
-                lambda: self.embedding_model.encode(item.content).tolist()
-            )
+        return await self.store_many([item])
 
-            # Prepare metadata for Chroma
-            chroma_metadata = {
-                "memory_type": item.memory_type,
-                "timestamp": item.timestamp.isoformat(),
-                **{k: str(v) for k, v in item.metadata.items()}  # Convert all to strings
-            }
+    async def store_many(self, items: List[MemoryItem]) -> bool:
+        """Store a batch of memory items with a single Chroma add"""
+        if not items:
+            return True
 
-            # Store in Chroma
-            await loop.run_in_executor(
-                None,
-                lambda: self.collection.add(
-                    embeddings=[embedding],
-                    documents=[item.content],
-                    metadatas=[chroma_metadata],
-                    ids=[item.id]
-                )
+        try:
+            ids, texts, chroma_metadatas = [], [], []
+            for item in items:
+                for chunk_id, chunk_text, chunk_metadata in self._chunk_item(item.id, item):
+                    ids.append(chunk_id)
+                    texts.append(chunk_text)
+                    chroma_metadatas.append(chunk_metadata)
+
+            # Store in Chroma; all contents are embedded in one batch
+            await asyncio.to_thread(
+                self.collection.add,
+                documents=texts,
+                metadatas=chroma_metadatas,
+                ids=ids
             )
 
             return True
 
         except Exception as e:
-            print(f"Error storing memory item: {e}")
+            print(f"Error storing memory items: {e}")
             return False
 
     async def retrieve(self, query: MemoryQuery) -> MemoryResult:
@@ -76,51 +130,47 @@ class ChromaMemoryStore(BaseMemoryStore):
         start_time = time.time()
 
         try:
-            # Generate embedding for the query
-            loop = asyncio.get_event_loop()
-            query_embedding = await loop.run_in_executor(
-                None,
-                lambda: self.embedding_model.encode(query.query).tolist()
-            )
-
             # Prepare where clause for filtering
             where_clause = {}
             if query.memory_types:
                 where_clause["memory_type"] = {"$in": query.memory_types}
 
-            # Query Chroma
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.collection.query(
-                    query_embeddings=[query_embedding],
-                    n_results=query.limit,
-                    where=where_clause if where_clause else None
-                )
+            # Query Chroma for distances and metadata only; documents are
+            # fetched afterwards for the hits that pass the threshold
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_texts=[query.query],
+                n_results=query.limit * RETRIEVE_OVERFETCH,
+                where=where_clause if where_clause else None,
+                include=["distances", "metadatas"]
             )
 
-            # Convert results to MemoryItem objects
-            memory_items = []
-            if results['documents']:
-                for i, doc in enumerate(results['documents'][0]):
-                    metadata = results['metadatas'][0][i]
-                    distance = results['distances'][0][i] if results['distances'] else 0.0
+            # Filter by similarity threshold
+            kept = []
+            if results['ids']:
+                ids = results['ids'][0]
+                metadatas = results['metadatas'][0]
+                distances = results['distances'][0] if results['distances'] else [0.0] * len(ids)
 
-                    # Filter by similarity threshold
-                    similarity = 1.0 - distance  # Convert distance to similarity
+                for item_id, metadata, distance in zip(ids, metadatas, distances):
+                    similarity = self._similarity(distance)
                     if similarity >= query.similarity_threshold:
-                        # Parse metadata
-                        parsed_metadata = {k: v for k, v in metadata.items()
-                                         if k not in ['memory_type', 'timestamp']}
-
-                        memory_item = MemoryItem(
-                            id=results['ids'][0][i],
-                            content=doc,
-                            metadata=parsed_metadata,
-                            timestamp=datetime.fromisoformat(metadata['timestamp']),
-                            memory_type=metadata['memory_type']
-                        )
-                        memory_item.metadata['similarity_score'] = similarity
-                        memory_items.append(memory_item)
+                        kept.append((item_id, metadata, similarity))
+
+            # Convert results to full MemoryItem objects, one per parent item
+            # scored by its best-matching chunk, trimmed to the requested limit
+            similarities = {}
+            for item_id, metadata, similarity in kept:
+                if len(similarities) == query.limit:
+                    break
+                similarities.setdefault(metadata.get("parent_id", item_id), similarity)
+
+            memory_items = await self._load_items([
+                (item_id, metadata) for item_id, metadata, _ in kept
+                if metadata.get("parent_id", item_id) in similarities
+            ])
+            for memory_item in memory_items:
+                memory_item.metadata['similarity_score'] = similarities[memory_item.id]
 
             query_time = time.time() - start_time
 
@@ -137,26 +187,174 @@ class ChromaMemoryStore(BaseMemoryStore):
     async def update(self, item_id: str, item: MemoryItem) -> bool:
         """Update an existing memory item"""
         try:
-            # Delete the old item
-            await self.delete(item_id)
+            chunks = self._chunk_item(item_id, item)
+
+            # Upsert merges metadata into the stored record, which would keep
+            # keys the new version dropped, so replace every chunk instead
+            await asyncio.to_thread(self.collection.delete, ids=[item_id])
+            await asyncio.to_thread(self.collection.delete, where={"parent_id": item_id})
+            await asyncio.to_thread(
+                self.collection.add,
+                documents=[text for _, text, _ in chunks],
+                metadatas=[metadata for _, _, metadata in chunks],
+                ids=[chunk_id for chunk_id, _, _ in chunks]
+            )
 
-            # Store the updated item with the same ID
-            updated_item = item.copy()
-            updated_item.id = item_id
-            return await self.store(updated_item)
+            return True
 
         except Exception as e:
             print(f"Error updating memory item: {e}")
             return False
 
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts in a single model call"""
+        return self.embedding_model.encode(
+            texts,
+            batch_size=min(64, len(texts)),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).tolist()
+
+    def _chunk_item(self, item_id: str, item: MemoryItem) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Split an item into (id, text, metadata) rows that fit the embedding window"""
+        chroma_metadata = self._to_chroma_metadata(item)
+        content = item.content
+
+        # Leave room for the [CLS]/[SEP] tokens the model adds
+        window = MAX_SEQ_LENGTH - 2
+        offsets = self.embedding_model.tokenizer(
+            content,
+            add_special_tokens=False,
+            return_offsets_mapping=True
+        )["offset_mapping"]
+
+        if len(offsets) <= window:
+            return [(item_id, content, chroma_metadata)]
+
+        chunks = []
+        step = window - CHUNK_OVERLAP
+        for index, start in enumerate(range(0, len(offsets) - CHUNK_OVERLAP, step)):
+            window_offsets = offsets[start:start + window]
+            chunk_id = item_id if index == 0 else f"{item_id}#{index}"
+            chunk_metadata = {
+                **chroma_metadata,
+                "parent_id": item_id,
+                "chunk_index": index,
+                # Where the chunk starts relative to the first one, for rejoining
+                "chunk_start": window_offsets[0][0] - offsets[0][0]
+            }
+            chunk_text = content[window_offsets[0][0]:window_offsets[-1][1]]
+            chunks.append((chunk_id, chunk_text, chunk_metadata))
+
+        return chunks
+
+    async def _load_items(self, rows: List[Tuple[str, Dict[str, Any]]]) -> List[MemoryItem]:
+        """Load the full item behind each matched (id, metadata) row, one per parent, in row order"""
+        order = []
+        seen = set()
+        whole_ids = []
+        chunked_ids = []
+        for row_id, metadata in rows:
+            parent_id = metadata.get("parent_id", row_id)
+            if parent_id in seen:
+                continue
+            seen.add(parent_id)
+            order.append(parent_id)
+            (chunked_ids if "parent_id" in metadata else whole_ids).append(parent_id)
+
+        fetches = []
+        if whole_ids:
+            fetches.append(asyncio.to_thread(
+                self.collection.get,
+                ids=whole_ids,
+                include=["documents", "metadatas"]
+            ))
+        if chunked_ids:
+            # Every chunk of a long item, so its content can be rejoined
+            fetches.append(asyncio.to_thread(
+                self.collection.get,
+                where={"parent_id": {"$in": chunked_ids}},
+                include=["documents", "metadatas"]
+            ))
+
+        parts_by_parent: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+        for result in await asyncio.gather(*fetches):
+            for row_id, document, metadata in zip(result['ids'], result['documents'], result['metadatas']):
+                parent_id = metadata.get("parent_id", row_id)
+                parts_by_parent.setdefault(parent_id, []).append((row_id, document, metadata))
+
+        memory_items = []
+        for parent_id in order:
+            parts = parts_by_parent.get(parent_id)
+            if not parts:
+                continue
+            parts.sort(key=lambda part: part[2].get("chunk_index", 0))
+            first_id, _, first_metadata = parts[0]
+            memory_items.append(self._from_chroma(first_id, self._join_chunks(parts), first_metadata))
+
+        return memory_items
+
+    @staticmethod
+    def _join_chunks(parts: List[Tuple[str, str, Dict[str, Any]]]) -> str:
+        """Rebuild an item's content from its ordered, overlapping chunks"""
+        content = ""
+        for _, text, metadata in parts:
+            start = metadata.get("chunk_start")
+            if start is not None:
+                # Each chunk starts inside the previous one, so it replaces the overlap
+                content = content[:start] + text
+            else:
+                # Chunks stored before offsets were recorded; the overlap is kept
+                content = f"{content} {text}" if content else text
+        return content
+
+    def _to_chroma_metadata(self, item: MemoryItem) -> Dict[str, Any]:
+        """Flatten a memory item's metadata into Chroma's metadata format"""
+        return {
+            "memory_type": item.memory_type,
+            "timestamp": item.timestamp.timestamp(),  # Epoch seconds, cheap to decode
+            **{
+                # Chroma stores scalars natively; lists/dicts are JSON-encoded
+                k: v if isinstance(v, (str, int, float, bool)) else json_codec.dumps(v)
+                for k, v in item.metadata.items()
+                if v is not None  # Chroma rejects None metadata values
+            }
+        }
+
+    def _from_chroma(self, item_id: str, document: str, metadata: Dict[str, Any]) -> MemoryItem:
+        """Rebuild a memory item from a Chroma row"""
+        parsed_metadata = dict(metadata)
+        memory_type = parsed_metadata.pop('memory_type')
+        timestamp = parsed_metadata.pop('timestamp')
+        # Chunks of a long item report the id of the item they belong to
+        item_id = parsed_metadata.pop('parent_id', item_id)
+        parsed_metadata.pop('chunk_index', None)
+        parsed_metadata.pop('chunk_start', None)
+
+        for k, v in parsed_metadata.items():
+            if isinstance(v, str) and v[:1] in ('[', '{'):
+                try:
+                    parsed_metadata[k] = json_codec.loads(v)
+                except ValueError:
+                    pass
+
+        return MemoryItem(
+            id=item_id,
+            content=document,
+            metadata=parsed_metadata,
+            # Items written before epoch timestamps were stored as ISO strings
+            timestamp=(datetime.fromisoformat(timestamp) if isinstance(timestamp, str)
+                       else datetime.fromtimestamp(timestamp)),
+            memory_type=memory_type
+        )
+
     async def delete(self, item_id: str) -> bool:
         """Delete a memory item"""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self.collection.delete(ids=[item_id])
-            )
+            await asyncio.to_thread(self.collection.delete, ids=[item_id])
+            # Remove any remaining chunks of a long item
+            await asyncio.to_thread(self.collection.delete, where={"parent_id": item_id})
             return True
 
         except Exception as e:
@@ -166,17 +364,10 @@ class ChromaMemoryStore(BaseMemoryStore):
     async def clear(self) -> bool:
         """Clear all memory items"""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self.client.delete_collection(name=self.collection_name)
-            )
+            await asyncio.to_thread(self.client.delete_collection, name=self.collection_name)
 
             # Recreate the collection
-            self.collection = self.client.create_collection(
-                name=self.collection_name,
-                metadata={"description": "Athena research memory store"}
-            )
+            self.collection = self._get_or_create_collection()
             return True
 
         except Exception as e:
@@ -186,11 +377,7 @@ class ChromaMemoryStore(BaseMemoryStore):
     async def get_stats(self) -> Dict[str, Any]:
         """Get memory store statistics"""
         try:
-            loop = asyncio.get_event_loop()
-            count = await loop.run_in_executor(
-                None,
-                lambda: self.collection.count()
-            )
+            count = await asyncio.to_thread(self.collection.count)
 
             return {
                 "total_items": count,
@@ -213,32 +400,30 @@ class ChromaMemoryStore(BaseMemoryStore):
 
         # For type-based retrieval, we'll query without embedding similarity
         try:
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.collection.get(
+            # The limit counts items, but Chroma counts chunks, so page through
+            # the rows until enough distinct items have been seen
+            rows = []
+            parent_ids = set()
+            offset = 0
+            while len(parent_ids) < limit:
+                results = await asyncio.to_thread(
+                    self.collection.get,
                     where={"memory_type": memory_type},
-                    limit=limit
+                    limit=limit,
+                    offset=offset,
+                    include=["metadatas"]
                 )
-            )
+                for item_id, metadata in zip(results['ids'], results['metadatas']):
+                    parent_id = metadata.get("parent_id", item_id)
+                    if parent_id not in parent_ids and len(parent_ids) < limit:
+                        parent_ids.add(parent_id)
+                        rows.append((item_id, metadata))
+
+                if len(results['ids']) < limit:
+                    break
+                offset += limit
 
-            memory_items = []
-            if results['documents']:
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i]
-                    parsed_metadata = {k: v for k, v in metadata.items()
-                                     if k not in ['memory_type', 'timestamp']}
-
-                    memory_item = MemoryItem(
-                        id=results['ids'][i],
-                        content=doc,
-                        metadata=parsed_metadata,
-                        timestamp=datetime.fromisoformat(metadata['timestamp']),
-                        memory_type=metadata['memory_type']
-                    )
-                    memory_items.append(memory_item)
-
-            return memory_items
+            return await self._load_items(rows)
 
         except Exception as e:
             print(f"Error getting items by type: {e}")
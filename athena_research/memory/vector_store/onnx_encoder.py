@@ -0,0 +1,79 @@
+from typing import List
+import os
+import numpy as np
+
+class OnnxSentenceEncoder:
+    """Sentence embeddings from an ONNX Runtime export of a transformer model.
+
+    Exposes the subset of the SentenceTransformer interface used by the
+    memory store (``encode``, ``tokenizer`` and ``max_seq_length``).
+    """
+
+    def __init__(self, model_name: str, cache_dir: str, max_seq_length: int = 256):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        self.max_seq_length = max_seq_length
+
+        # Run on the GPU when ORT was built with CUDA support
+        if "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+            provider = "CUDAExecutionProvider"
+        else:
+            provider = "CPUExecutionProvider"
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+
+        # Export once and reuse the cached graph on later starts
+        export_dir = os.path.join(cache_dir, model_name.replace("/", "--"))
+        if os.path.exists(os.path.join(export_dir, "model.onnx")):
+            self.model = ORTModelForFeatureExtraction.from_pretrained(
+                export_dir,
+                provider=provider,
+                session_options=session_options
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        else:
+            self.model = ORTModelForFeatureExtraction.from_pretrained(
+                model_name,
+                export=True,
+                provider=provider,
+                session_options=session_options
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.model.save_pretrained(export_dir)
+            self.tokenizer.save_pretrained(export_dir)
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 64,
+        normalize_embeddings: bool = False,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """Embed sentences with mean pooling over the last hidden state"""
+        batches = []
+
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            # Keep FP16 graphs in FP16 instead of upcasting the hidden states
+            mask = inputs["attention_mask"].astype(hidden.dtype)
+
+            # Masked mean pooling without materializing hidden * mask
+            embeddings = np.einsum('bsd,bs->bd', hidden, mask, optimize=True)
+            embeddings /= np.clip(mask.sum(axis=1, keepdims=True), 1e-9, None)
+            if normalize_embeddings:
+                embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+            batches.append(embeddings)
+
+        return np.concatenate(batches) if batches else np.empty((0, 0), dtype=np.float32)
@@ -2,6 +2,115 @@ from typing import Any, Dict, List, Optional
 from ag2 import Tool
 from ...memory import MemoryManager, MemoryItem
 
+_STORE_FACT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "content": {
+            "type": "string",
+            "description": "The fact to store"
+        },
+        "importance": {
+            "type": "string",
+            "description": "Importance level",
+            "enum": ["low", "medium", "high"],
+            "default": "medium"
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Tags for categorization"
+        }
+    },
+    "required": ["content"]
+}
+
+_RETRIEVE_FACTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Query to search for facts"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of facts to return",
+            "default": 10
+        },
+        "similarity_threshold": {
+            "type": "number",
+            "description": "Minimum similarity threshold",
+            "default": 0.7
+        }
+    },
+    "required": ["query"]
+}
+
+_STORE_SOURCE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {
+            "type": "string",
+            "description": "Source title"
+        },
+        "content": {
+            "type": "string",
+            "description": "Source content"
+        },
+        "url": {
+            "type": "string",
+            "description": "Source URL"
+        },
+        "source_type": {
+            "type": "string",
+            "description": "Type of source",
+            "default": "web"
+        }
+    },
+    "required": ["title", "content"]
+}
+
+_RETRIEVE_SOURCES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Query to search for sources"
+        },
+        "source_types": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Filter by source types"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of sources to return",
+            "default": 10
+        }
+    },
+    "required": ["query"]
+}
+
+_SEARCH_MEMORY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query"
+        },
+        "memory_types": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Memory types to search: fact, source, conversation, plan"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum results to return",
+            "default": 20
+        }
+    },
+    "required": ["query"]
+}
+
 class AthenaMemoryTools:
     """AG2 tools wrapper for Athena memory capabilities"""
 
@@ -17,27 +126,7 @@ class AthenaMemoryTools:
         store_fact_tool = Tool(
             name="store_fact",
             description="Store an important research fact in memory",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "The fact to store"
-                    },
-                    "importance": {
-                        "type": "string",
-                        "description": "Importance level",
-                        "enum": ["low", "medium", "high"],
-                        "default": "medium"
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Tags for categorization"
-                    }
-                },
-                "required": ["content"]
-            }
+            parameters=_STORE_FACT_SCHEMA
         )(self._store_fact)
 
         tools.append(store_fact_tool)
@@ -46,26 +135,7 @@ class AthenaMemoryTools:
         retrieve_facts_tool = Tool(
             name="retrieve_facts",
             description="Retrieve relevant facts from memory",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Query to search for facts"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of facts to return",
-                        "default": 10
-                    },
-                    "similarity_threshold": {
-                        "type": "number",
-                        "description": "Minimum similarity threshold",
-                        "default": 0.7
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_RETRIEVE_FACTS_SCHEMA
         )(self._retrieve_facts)
 
         tools.append(retrieve_facts_tool)
@@ -74,29 +144,7 @@ class AthenaMemoryTools:
         store_source_tool = Tool(
             name="store_source",
             description="Store a research source in memory",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Source title"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Source content"
-                    },
-                    "url": {
-                        "type": "string",
-                        "description": "Source URL"
-                    },
-                    "source_type": {
-                        "type": "string",
-                        "description": "Type of source",
-                        "default": "web"
-                    }
-                },
-                "required": ["title", "content"]
-            }
+            parameters=_STORE_SOURCE_SCHEMA
         )(self._store_source)
 
         tools.append(store_source_tool)
@@ -105,26 +153,7 @@ class AthenaMemoryTools:
         retrieve_sources_tool = Tool(
             name="retrieve_sources",
             description="Retrieve relevant sources from memory",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Query to search for sources"
-                    },
-                    "source_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by source types"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of sources to return",
-                        "default": 10
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_RETRIEVE_SOURCES_SCHEMA
         )(self._retrieve_sources)
 
         tools.append(retrieve_sources_tool)
@@ -133,26 +162,7 @@ class AthenaMemoryTools:
         search_memory_tool = Tool(
             name="search_memory",
             description="Search across all memory types",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "memory_types": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Memory types to search: fact, source, conversation, plan"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results to return",
-                        "default": 20
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_SEARCH_MEMORY_SCHEMA
         )(self._search_memory)
 
         tools.append(search_memory_tool)
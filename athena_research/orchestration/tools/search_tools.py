@@ -4,6 +4,66 @@ from ag2 import Tool
 from ...data_sources import AzureSearchTool, TavilySearchTool, BingSearchTool
 from ...agents.research.research_agent import SearchResult
 
+_WEB_SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "The search query"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10
+        },
+        "search_type": {
+            "type": "string",
+            "description": "Type of search: web, news, academic",
+            "enum": ["web", "news", "academic"],
+            "default": "web"
+        }
+    },
+    "required": ["query"]
+}
+
+_AZURE_SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "The search query"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10
+        }
+    },
+    "required": ["query"]
+}
+
+_MULTI_SOURCE_SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "The search query"
+        },
+        "sources": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Sources to search: web, azure, news",
+            "default": ["web", "azure"]
+        },
+        "max_results_per_source": {
+            "type": "integer",
+            "description": "Maximum results per source",
+            "default": 5
+        }
+    },
+    "required": ["query"]
+}
+
 class AthenaSearchTools:
     """AG2 tools wrapper for Athena search capabilities"""
 
@@ -19,27 +79,7 @@ class AthenaSearchTools:
         web_search_tool = Tool(
             name="web_search",
             description="Search the web for information on a given topic",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search query"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10
-                    },
-                    "search_type": {
-                        "type": "string",
-                        "description": "Type of search: web, news, academic",
-                        "enum": ["web", "news", "academic"],
-                        "default": "web"
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_WEB_SEARCH_SCHEMA
         )(self._web_search)
 
         tools.append(web_search_tool)
@@ -48,21 +88,7 @@ class AthenaSearchTools:
         azure_search_tool = Tool(
             name="azure_search",
             description="Search internal documents using Azure AI Search",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search query"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_AZURE_SEARCH_SCHEMA
         )(self._azure_search)
 
         tools.append(azure_search_tool)
@@ -71,27 +97,7 @@ class AthenaSearchTools:
         multi_search_tool = Tool(
             name="multi_source_search",
             description="Search across multiple sources (web, Azure, etc.) for comprehensive results",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search query"
-                    },
-                    "sources": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Sources to search: web, azure, news",
-                        "default": ["web", "azure"]
-                    },
-                    "max_results_per_source": {
-                        "type": "integer",
-                        "description": "Maximum results per source",
-                        "default": 5
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=_MULTI_SOURCE_SEARCH_SCHEMA
         )(self._multi_source_search)
 
         tools.append(multi_search_tool)
@@ -199,6 +205,17 @@ class AthenaSearchTools:
             "sources_searched": sources
         }
 
+    async def search_queries(
+        self,
+        queries: List[str],
+        max_results_per_source: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Run multi-source searches for several known queries concurrently"""
+        return await asyncio.gather(*(
+            self._multi_source_search(query, max_results_per_source=max_results_per_source)
+            for query in queries
+        ))
+
     def _serialize_search_result(self, result: SearchResult) -> Dict[str, Any]:
         """Convert SearchResult to serializable dict"""
         return {
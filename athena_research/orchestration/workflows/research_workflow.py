@@ -1,46 +1,193 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import asyncio
-from ag2 import ConversableAgent, initiate_chats
+import functools
+from types import MappingProxyType
+from ag2 import ConversableAgent, initiate_chats, Tool
+from pydantic import ValidationError
 from ...agents import (
-    PlanningAgent, ResearchAgent, SectionWriterAgent, FinalWriterAgent,
-    ResearchPlan, SectionContent
+    PlanningAgent, ResearchAgent, SectionWriterAgent,
+    ResearchPlan, ResearchSection
 )
 from ...data_sources import BaseSearchTool
 from ...memory import MemoryManager
 from ..tools.search_tools import AthenaSearchTools
 from ..tools.memory_tools import AthenaMemoryTools
+from ...utils.semantic_cache import SemanticPromptCache
+from ...utils.context_compressor import ContextCompressor
+from ...memory import json_codec
 from ...config import settings
 
+# Prompt templates, filled with str.format per call
+_PLANNING_PROMPT_TEMPLATE = """
+Create a comprehensive research plan for the topic: "{topic}"
+
+Requirements:
+- Report style: {report_style}
+- User requirements: {user_requirements}
+- Create 4-6 main sections
+- Generate 2-4 specific search queries per section
+- Order sections by importance
+
+Respond with only a JSON object of the form:
+{{"sections": [{{"title": "...", "description": "...", "queries": ["..."], "priority": 1}}]}}
+"""
+
+_RESEARCH_PROMPT_TEMPLATE = """
+Research the section: "{section_title}"
+
+Search results for the queries:
+{queries_bulleted}
+
+{search_results}
+
+Instructions:
+1. Summarize the key findings from these results for this section
+2. Store important findings using store_fact
+3. Use multi_source_search only if the results leave important gaps
+4. Focus on recent, credible information
+"""
+
+# Shared verbatim by every section writing prompt, ahead of the per-section
+# parts, so providers with prefix caching can reuse it
+_SECTION_WRITING_INSTRUCTIONS_TEMPLATE = """
+Instructions:
+1. Use retrieve_facts to get relevant stored facts
+2. Use retrieve_sources to get stored research sources
+3. Write 600-1000 words per section
+4. Include proper citations
+5. Maintain {report_style} writing style
+6. Create engaging, informative content
+7. Focus on accuracy and comprehensive coverage
+"""
+
+_SECTION_BRIEF_TEMPLATE = """Section: "{section_title}"
+- Queries executed: {queries_executed}
+- Research summary: {research_summary}"""
+
+_SECTION_WRITING_PROMPT_TEMPLATE = """{instructions}
+Write a comprehensive section for the following:
+
+{section_brief}
+"""
+
+_BATCH_WRITING_PROMPT_TEMPLATE = """{instructions}
+Write a comprehensive section for each of the following and respond
+with only a JSON object mapping each section title to its content.
+
+{section_briefs}
+"""
+
+# Sentences kept when condensing the written sections into the executive summary
+EXECUTIVE_SUMMARY_SENTENCES = 6
+
+# Model settings per agent, built once and shared read-only by every workflow
+_AGENT_LLM_CONFIGS = MappingProxyType({
+    "planning_agent": MappingProxyType({
+        "model": settings.planning_model,
+        "temperature": settings.default_temperature,
+        "max_tokens": settings.max_tokens
+    }),
+    "research_agent": MappingProxyType({
+        "model": settings.research_model,
+        "temperature": settings.default_temperature,
+        "max_tokens": settings.max_tokens
+    }),
+    "section_writer_agent": MappingProxyType({
+        "model": settings.writing_model,
+        "temperature": settings.default_temperature + 0.1,
+        "max_tokens": settings.max_tokens
+    })
+})
+
+def _run_chat(chat: Dict[str, Any]) -> List[Any]:
+    """Run a single AG2 chat, then make the shared recipient forget its dedicated sender"""
+    try:
+        return initiate_chats([chat])
+    finally:
+        # Recipients are shared across runs, so per-sender histories and reply
+        # counters would otherwise pile up with every throwaway proxy
+        recipient, sender = chat["recipient"], chat["sender"]
+        for state_name in (
+            "_oai_messages",
+            "_consecutive_auto_reply_counter",
+            "_max_consecutive_auto_reply_dict",
+            "reply_at_receive"
+        ):
+            getattr(recipient, state_name, {}).pop(sender, None)
+
+class _WorkflowRun:
+    """State of a single execute_research call, kept off the shared workflow"""
+
+    def __init__(self):
+        self.plan: Optional[Dict[str, Any]] = None
+        self.research_results: Dict[str, Dict[str, Any]] = {}
+        self.section_contents: List[Dict[str, Any]] = []
+
+        # Memory writes that run in the background of the workflow
+        self.pending_writes: List[asyncio.Task] = []
+
+@functools.lru_cache(maxsize=32)
+def _get_agent(name: str, system_message: str, tools: Tuple[Tool, ...]) -> ConversableAgent:
+    """Create an AG2 agent once per configuration and share it across workflows"""
+    return ConversableAgent(
+        name=name,
+        system_message=system_message,
+        # AG2 keeps its own mutable copy of the config
+        llm_config={"config_list": [dict(_AGENT_LLM_CONFIGS[name])]},
+        tools=list(tools),
+        human_input_mode="NEVER"
+    )
+
+@functools.lru_cache(maxsize=32)
+def _get_memory_tools(memory_manager: MemoryManager) -> AthenaMemoryTools:
+    """Share memory tool wrappers between workflows using the same memory manager"""
+    return AthenaMemoryTools(memory_manager)
+
+@functools.lru_cache(maxsize=32)
+def _get_search_tools(search_tools: Tuple[BaseSearchTool, ...]) -> AthenaSearchTools:
+    """Share search tool wrappers between workflows using the same search tools"""
+    return AthenaSearchTools(list(search_tools))
+
 class AthenaResearchWorkflow:
     """Multi-agent research workflow orchestrated with AG2"""
 
     def __init__(
         self,
         search_tools: List[BaseSearchTool],
-        memory_manager: Optional[MemoryManager] = None
+        memory_manager: Optional[MemoryManager] = None,
+        prompt_cache: Optional[SemanticPromptCache] = None
     ):
         self.search_tools = search_tools
         self.memory_manager = memory_manager or MemoryManager()
 
-        # Initialize tool wrappers
-        self.search_tools_wrapper = AthenaSearchTools(search_tools)
-        self.memory_tools_wrapper = AthenaMemoryTools(self.memory_manager)
+        # Share a cache across workflows to reuse answers for repeated prompts;
+        # the vector store's encoder is reused when available
+        encoder = getattr(self.memory_manager.vector_store, "embedding_model", None)
+        self.prompt_cache = prompt_cache or SemanticPromptCache(encoder=encoder)
+
+        # Trims research summaries before they reach the writer prompts
+        self.context_compressor = ContextCompressor(encoder=encoder)
 
-        # Initialize agents
+        # Initialize tool wrappers
+        self.search_tools_wrapper = _get_search_tools(tuple(search_tools))
+        self.memory_tools_wrapper = _get_memory_tools(self.memory_manager)
+        self._memory_tools = tuple(self.memory_tools_wrapper.get_tools())
+        self._search_tools = tuple(self.search_tools_wrapper.get_tools())
+
+        # Initialize agents; agents are cached per configuration and the
+        # workflow may serve concurrent requests, so per-request state lives
+        # on a _WorkflowRun
         self.planning_agent = self._create_planning_agent()
         self.research_agent = self._create_research_agent()
         self.section_writer_agent = self._create_section_writer_agent()
-        self.final_writer_agent = self._create_final_writer_agent()
         self.user_proxy = self._create_user_proxy()
 
-        # Store research state
-        self.current_plan = None
-        self.research_results = {}
-        self.section_contents = []
+        # Most recent run, reported by get_workflow_status
+        self._last_run = _WorkflowRun()
 
     def _create_planning_agent(self) -> ConversableAgent:
         """Create AG2 planning agent"""
-        return ConversableAgent(
+        return _get_agent(
             name="planning_agent",
             system_message="""You are a research planning expert. Your role is to:
 1. Analyze research topics and create comprehensive research plans
@@ -49,25 +196,12 @@ class AthenaResearchWorkflow:
 4. Refine plans based on research findings
 
 Always provide structured, actionable plans that guide the research process.""",
-            llm_config={
-                "config_list": [{
-                    "model": settings.planning_model,
-                    "temperature": settings.default_temperature,
-                    "max_tokens": settings.max_tokens
-                }]
-            },
-            tools=self.memory_tools_wrapper.get_tools(),
-            human_input_mode="NEVER"
+            tools=self._memory_tools
         )
 
     def _create_research_agent(self) -> ConversableAgent:
         """Create AG2 research agent"""
-        all_tools = (
-            self.search_tools_wrapper.get_tools() +
-            self.memory_tools_wrapper.get_tools()
-        )
-
-        return ConversableAgent(
+        return _get_agent(
             name="research_agent",
             system_message="""You are a thorough research specialist. Your role is to:
 1. Execute comprehensive searches using available tools
@@ -77,20 +211,12 @@ Always provide structured, actionable plans that guide the research process.""",
 5. Provide detailed research summaries
 
 Always prioritize accuracy and comprehensive coverage of research topics.""",
-            llm_config={
-                "config_list": [{
-                    "model": settings.research_model,
-                    "temperature": settings.default_temperature,
-                    "max_tokens": settings.max_tokens
-                }]
-            },
-            tools=all_tools,
-            human_input_mode="NEVER"
+            tools=self._search_tools + self._memory_tools
         )
 
     def _create_section_writer_agent(self) -> ConversableAgent:
         """Create AG2 section writer agent"""
-        return ConversableAgent(
+        return _get_agent(
             name="section_writer_agent",
             system_message="""You are an expert content writer specializing in research reports. Your role is to:
 1. Transform research findings into well-structured sections
@@ -100,39 +226,7 @@ Always prioritize accuracy and comprehensive coverage of research topics.""",
 5. Ensure each section contributes meaningfully to the overall report
 
 Focus on clarity, accuracy, and professional presentation.""",
-            llm_config={
-                "config_list": [{
-                    "model": settings.writing_model,
-                    "temperature": settings.default_temperature + 0.1,
-                    "max_tokens": settings.max_tokens
-                }]
-            },
-            tools=self.memory_tools_wrapper.get_tools(),
-            human_input_mode="NEVER"
-        )
-
-    def _create_final_writer_agent(self) -> ConversableAgent:
-        """Create AG2 final writer agent"""
-        return ConversableAgent(
-            name="final_writer_agent",
-            system_message="""You are a report compilation expert. Your role is to:
-1. Combine individual sections into a cohesive final report
-2. Create executive summaries and abstracts
-3. Ensure consistent formatting and style throughout
-4. Generate proper citations and bibliographies
-5. Add metadata and document structure
-6. Perform final quality checks
-
-Deliver polished, professional reports that meet high standards.""",
-            llm_config={
-                "config_list": [{
-                    "model": settings.writing_model,
-                    "temperature": settings.default_temperature,
-                    "max_tokens": settings.max_tokens
-                }]
-            },
-            tools=self.memory_tools_wrapper.get_tools(),
-            human_input_mode="NEVER"
+            tools=self._memory_tools
         )
 
     def _create_user_proxy(self) -> ConversableAgent:
@@ -152,37 +246,46 @@ Deliver polished, professional reports that meet high standards.""",
         user_requirements: str = ""
     ) -> Dict[str, Any]:
         """Execute the complete multi-agent research workflow"""
+        run = self._last_run = _WorkflowRun()
 
         try:
+            # Sections flow from planning through research and writing as soon
+            # as they are decided, so the phases overlap section by section
+            section_queue: asyncio.Queue = asyncio.Queue()
+            pipeline = asyncio.create_task(self._execute_section_pipeline(run, section_queue, report_style))
+
             # Phase 1: Planning
             print("Phase 1: Research Planning")
-            plan_result = await self._execute_planning_phase(topic, report_style, user_requirements)
+            plan_result = await self._execute_planning_phase(
+                run,
+                topic,
+                report_style,
+                user_requirements,
+                section_queue
+            )
 
             if not plan_result["success"]:
+                pipeline.cancel()
                 return {"success": False, "error": "Planning phase failed", "details": plan_result}
 
-            # Phase 2: Research
+            # Phases 2 and 3: Research and Section Writing, pipelined per section
             print("Phase 2: Information Gathering")
-            research_result = await self._execute_research_phase(plan_result["plan"])
-
-            if not research_result["success"]:
-                return {"success": False, "error": "Research phase failed", "details": research_result}
-
-            # Phase 3: Section Writing
             print("Phase 3: Content Creation")
-            writing_result = await self._execute_writing_phase(
-                plan_result["plan"],
-                research_result["research_data"]
-            )
+            pipeline_result = await pipeline
 
-            if not writing_result["success"]:
-                return {"success": False, "error": "Writing phase failed", "details": writing_result}
+            if not pipeline_result["success"]:
+                if not pipeline_result["sections"]:
+                    return {"success": False, "error": "Research and writing failed", "details": pipeline_result}
+
+                # Assemble a degraded report from the sections that completed
+                print(f"Continuing with {pipeline_result['total_sections']} completed sections: {pipeline_result.get('error')}")
 
             # Phase 4: Final Report Assembly
             print("Phase 4: Report Assembly")
             final_result = await self._execute_final_phase(
                 topic,
-                writing_result["sections"],
+                pipeline_result["sections"],
+                pipeline_result["research_data"],
                 report_style
             )
 
@@ -193,8 +296,10 @@ Deliver polished, professional reports that meet high standards.""",
                     "topic": topic,
                     "report_style": report_style,
                     "phases_completed": ["planning", "research", "writing", "assembly"],
-                    "total_sources": sum(len(data.get("sources", [])) for data in research_result["research_data"].values()),
-                    "total_sections": len(writing_result["sections"])
+                    "total_sources": pipeline_result["total_sources"],
+                    "total_sections": pipeline_result["total_sections"],
+                    "degraded": not pipeline_result["success"],
+                    "errors": pipeline_result.get("error")
                 }
             }
 
@@ -204,45 +309,43 @@ Deliver polished, professional reports that meet high standards.""",
                 "error": f"Workflow execution failed: {str(e)}"
             }
 
+        finally:
+            # Make background memory writes durable before returning
+            await asyncio.gather(*run.pending_writes, return_exceptions=True)
+            run.pending_writes.clear()
+
     async def _execute_planning_phase(
         self,
+        run: _WorkflowRun,
         topic: str,
         report_style: str,
-        user_requirements: str
+        user_requirements: str,
+        section_queue: Optional[asyncio.Queue] = None
     ) -> Dict[str, Any]:
-        """Execute the planning phase"""
+        """Execute the planning phase, handing each section to the queue once decided"""
         try:
-            # Create planning prompt
-            planning_prompt = f"""
-            Create a comprehensive research plan for the topic: "{topic}"
-
-            Requirements:
-            - Report style: {report_style}
-            - User requirements: {user_requirements}
-            - Create 4-6 main sections
-            - Generate 2-4 specific search queries per section
-            - Prioritize sections by importance
-
-            Use the store_fact tool to save important planning decisions.
-            """
-
-            # Initiate planning conversation
-            chat_result = initiate_chats([{
-                "sender": self.user_proxy,
-                "recipient": self.planning_agent,
-                "message": planning_prompt,
-                "max_turns": 3,
-                "summary_method": "reflection_with_llm"
-            }])
-
-            # Extract plan from conversation (simplified - in practice would parse structured output)
-            # For now, create a basic plan structure
-            plan_sections = [
-                {"title": f"Introduction to {topic}", "queries": [f"what is {topic}", f"{topic} definition"]},
-                {"title": f"Current State of {topic}", "queries": [f"{topic} 2024", f"latest {topic} developments"]},
-                {"title": f"Applications and Use Cases", "queries": [f"{topic} applications", f"{topic} examples"]},
-                {"title": f"Future Outlook", "queries": [f"future of {topic}", f"{topic} predictions"]}
-            ]
+            # Reuse the section structure of a plan made for a similar topic
+            cached_plan = await self.memory_manager.lookup_plan_template(topic)
+
+            if cached_plan:
+                plan_sections = self._adapt_plan_sections(cached_plan, topic)
+            else:
+                # A single structured reply drives the plan sections
+                plan_sections = await self._generate_plan_sections(topic, report_style, user_requirements)
+
+            if not plan_sections:
+                # Fall back to a basic plan structure
+                plan_sections = [
+                    {"title": f"Introduction to {topic}", "queries": [f"what is {topic}", f"{topic} definition"]},
+                    {"title": f"Current State of {topic}", "queries": [f"{topic} 2024", f"latest {topic} developments"]},
+                    {"title": f"Applications and Use Cases", "queries": [f"{topic} applications", f"{topic} examples"]},
+                    {"title": f"Future Outlook", "queries": [f"future of {topic}", f"{topic} predictions"]}
+                ]
+
+            # Let research start on the sections while the plan is stored
+            if section_queue is not None:
+                for section in plan_sections:
+                    section_queue.put_nowait(section)
 
             plan = {
                 "topic": topic,
@@ -250,162 +353,418 @@ Deliver polished, professional reports that meet high standards.""",
                 "report_style": report_style,
                 "user_requirements": user_requirements
             }
+            run.plan = plan
 
-            # Store plan in memory
-            await self.memory_manager.store_plan(plan)
+            # Store plan in memory without holding up the research phase
+            run.pending_writes.append(asyncio.create_task(self.memory_manager.store_plan(plan)))
+            if not cached_plan:
+                run.pending_writes.append(
+                    asyncio.create_task(self.memory_manager.store_plan_template(topic, plan))
+                )
 
             return {"success": True, "plan": plan}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _execute_research_phase(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the research phase"""
-        try:
-            research_data = {}
-
-            # Create research tasks for each section
-            for section in plan["sections"]:
-                section_title = section["title"]
-                queries = section["queries"]
-
-                research_prompt = f"""
-                Research the section: "{section_title}"
-
-                Use these specific queries:
-                {chr(10).join(f"- {query}" for query in queries)}
-
-                Instructions:
-                1. Use multi_source_search for comprehensive coverage
-                2. Store important findings using store_fact
-                3. Store valuable sources using store_source
-                4. Focus on recent, credible information
-                5. Gather at least 10 quality sources per section
-                """
-
-                # Execute research conversation
-                chat_result = initiate_chats([{
-                    "sender": self.user_proxy,
-                    "recipient": self.research_agent,
-                    "message": research_prompt,
-                    "max_turns": 5,
-                    "summary_method": "reflection_with_llm"
-                }])
-
-                # In a real implementation, would extract structured research data
-                # For now, store basic research metadata
-                research_data[section_title] = {
-                    "queries_executed": queries,
-                    "chat_summary": chat_result[0].summary if chat_result else "",
-                    "sources": []  # Would be populated from actual research
-                }
+        finally:
+            # Signal the end of the plan to the section pipeline
+            if section_queue is not None:
+                section_queue.put_nowait(None)
 
-            return {"success": True, "research_data": research_data}
+    async def _generate_plan_sections(
+        self,
+        topic: str,
+        report_style: str,
+        user_requirements: str
+    ) -> List[Dict[str, Any]]:
+        """Ask the planning agent for the plan sections in a single JSON reply"""
+        planning_prompt = _PLANNING_PROMPT_TEMPLATE.format(
+            topic=topic,
+            report_style=report_style,
+            user_requirements=user_requirements
+        )
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        def generate_plan() -> str:
+            reply = self.planning_agent.generate_reply(
+                messages=[{"role": "user", "content": planning_prompt}]
+            )
+            if isinstance(reply, dict):
+                return reply.get("content") or ""
+            return reply or ""
+
+        async def run_planning() -> str:
+            return await asyncio.to_thread(generate_plan)
+
+        model = self.planning_agent.llm_config["config_list"][0]["model"]
+        reply = await self.prompt_cache.get_or_compute(
+            planning_prompt,
+            run_planning,
+            namespace=(self.planning_agent.name, model, "planning")
+        )
+
+        plan_sections = []
+        for section in self._parse_json_object(reply).get("sections", []):
+            try:
+                research_section = ResearchSection(**section)
+            except (TypeError, ValidationError):
+                continue
+            plan_sections.append({"title": research_section.title, "queries": research_section.queries})
+
+        return plan_sections
+
+    def _adapt_plan_sections(self, cached_plan: Dict[str, Any], topic: str) -> List[Dict[str, Any]]:
+        """Substitute a new topic into the sections of a plan made for a similar topic
+
+        The plan was matched by similarity, so its queries often do not name
+        the old topic verbatim; those would research the old topic and are
+        replaced with a query built from the new topic and the section title.
+        """
+        old_topic = cached_plan.get("topic", "")
+
+        sections = []
+        for section in cached_plan.get("sections", []):
+            title = section["title"].replace(old_topic, topic) if old_topic else section["title"]
+            queries = [
+                query.replace(old_topic, topic)
+                for query in section.get("queries", [])
+                if old_topic and old_topic in query
+            ]
+            if not queries:
+                queries = [title if topic in title else f"{topic} {title}"]
 
-    async def _execute_writing_phase(
+            sections.append({**section, "title": title, "queries": queries})
+
+        return sections
+
+    async def _execute_section_pipeline(
         self,
-        plan: Dict[str, Any],
-        research_data: Dict[str, Any]
+        run: _WorkflowRun,
+        section_queue: asyncio.Queue,
+        report_style: str
     ) -> Dict[str, Any]:
-        """Execute the section writing phase"""
+        """Research each section as soon as planning hands it over and write it once researched"""
+        # Completed sections are kept on the run as they finish so a failure
+        # elsewhere still leaves partial results to report on
+        planned_sections = []
+
         try:
-            sections = []
-
-            # Write each section
-            for section_info in plan["sections"]:
-                section_title = section_info["title"]
-                section_research = research_data.get(section_title, {})
-
-                writing_prompt = f"""
-                Write a comprehensive section for: "{section_title}"
-
-                Research context:
-                - Queries executed: {section_research.get('queries_executed', [])}
-                - Research summary: {section_research.get('chat_summary', '')}
-
-                Instructions:
-                1. Use retrieve_facts to get relevant stored facts
-                2. Use retrieve_sources to get stored research sources
-                3. Write 600-1000 words for this section
-                4. Include proper citations
-                5. Maintain {plan['report_style']} writing style
-                6. Create engaging, informative content
-
-                Focus on accuracy and comprehensive coverage.
-                """
-
-                # Execute writing conversation
-                chat_result = initiate_chats([{
-                    "sender": self.user_proxy,
-                    "recipient": self.section_writer_agent,
-                    "message": writing_prompt,
-                    "max_turns": 4,
-                    "summary_method": "reflection_with_llm"
-                }])
-
-                # Create section object (simplified)
-                section = {
-                    "title": section_title,
-                    "content": chat_result[0].summary if chat_result else f"Content for {section_title}",
-                    "word_count": 800,  # Would calculate actual count
-                    "citations": []  # Would extract from content
-                }
+            # Bound research to protect LLM rate limits; writing is a single
+            # batching consumer so it needs no separate bound
+            research_semaphore = asyncio.Semaphore(settings.max_parallel_sections)
+            researched_queue: asyncio.Queue = asyncio.Queue()
+            writer = asyncio.create_task(self._write_sections_batched(run, researched_queue, report_style))
+
+            tasks = []
+
+            while True:
+                section = await section_queue.get()
+                if section is None:
+                    break
+
+                planned_sections.append(section)
+                tasks.append(asyncio.create_task(
+                    self._research_into_queue(run, section, research_semaphore, researched_queue)
+                ))
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            researched_queue.put_nowait(None)
+            write_errors = await writer
+
+            # A failed section does not discard the sections that completed
+            errors = [
+                f"{section['title']}: {result}"
+                for section, result in zip(planned_sections, results)
+                if isinstance(result, Exception)
+            ]
+            errors.extend(write_errors)
+            return self._collect_pipeline_results(run, planned_sections, errors)
 
-                sections.append(section)
+        except Exception as e:
+            return self._collect_pipeline_results(run, planned_sections, [str(e)])
 
-            return {"success": True, "sections": sections}
+    def _collect_pipeline_results(
+        self,
+        run: _WorkflowRun,
+        planned_sections: List[Dict[str, Any]],
+        errors: List[str]
+    ) -> Dict[str, Any]:
+        """Gather the completed sections in plan order"""
+        written_sections = {section["title"]: section for section in run.section_contents}
+
+        research_data = {}
+        sections = []
+        total_sources = 0
+        for section in planned_sections:
+            section_research = run.research_results.get(section["title"])
+            if section_research is not None:
+                research_data[section["title"]] = section_research
+                total_sources += len(section_research.get("sources", []))
+            if section["title"] in written_sections:
+                sections.append(written_sections[section["title"]])
+
+        result = {
+            "success": not errors and len(sections) == len(planned_sections),
+            "research_data": research_data,
+            "sections": sections,
+            "total_sources": total_sources,
+            "total_sections": len(sections)
+        }
+        if errors:
+            result["error"] = "; ".join(errors)
+
+        return result
+
+    async def _research_into_queue(
+        self,
+        run: _WorkflowRun,
+        section: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        researched_queue: asyncio.Queue
+    ) -> Dict[str, Any]:
+        """Research a section and hand it to the writer as soon as it is done"""
+        section_research = await self._research_one_section(run, section, semaphore)
+        section_research["chat_summary"] = await asyncio.to_thread(
+            self.context_compressor.compress,
+            section_research["chat_summary"],
+            section["title"]
+        )
+        run.research_results[section["title"]] = section_research
+        researched_queue.put_nowait((section, section_research))
+        return section_research
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    async def _write_sections_batched(
+        self,
+        run: _WorkflowRun,
+        researched_queue: asyncio.Queue,
+        report_style: str
+    ) -> List[str]:
+        """Write researched sections, batching every section that is ready into one call
+
+        A failed batch is recorded and the writer keeps going, so sections
+        queued after it are still written. Returns the batch errors.
+        """
+        errors = []
+        finished = False
+
+        while not finished:
+            batch = [await researched_queue.get()]
+            while not researched_queue.empty():
+                batch.append(researched_queue.get_nowait())
+
+            finished = None in batch
+            batch = [entry for entry in batch if entry is not None]
+            if not batch:
+                continue
+
+            try:
+                run.section_contents.extend(await self._write_section_batch(batch, report_style))
+            except Exception as e:
+                titles = ", ".join(section_info["title"] for section_info, _ in batch)
+                errors.append(f"{titles}: writing failed: {e}")
+
+        return errors
+
+    async def _write_section_batch(
+        self,
+        batch: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        report_style: str
+    ) -> List[Dict[str, Any]]:
+        """Write several sections in a single conversation returning JSON content by title"""
+        if len(batch) == 1:
+            section_info, section_research = batch[0]
+            return [await self._write_one_section(section_info, section_research, report_style)]
+
+        writing_prompt = _BATCH_WRITING_PROMPT_TEMPLATE.format(
+            instructions=_SECTION_WRITING_INSTRUCTIONS_TEMPLATE.format(report_style=report_style),
+            section_briefs="\n\n".join(
+                self._section_brief(section_info, section_research)
+                for section_info, section_research in batch
+            )
+        )
+
+        summary = await self._cached_chat_summary("section_batch_writing", {
+            "sender": self._create_user_proxy(),
+            "recipient": self.section_writer_agent,
+            "message": writing_prompt,
+            "max_turns": 4,
+            "summary_method": "last_msg"
+        })
+        contents = self._parse_json_object(summary)
+
+        sections = []
+        missing = []
+        for section_info, section_research in batch:
+            content = contents.get(section_info["title"])
+            if isinstance(content, str) and content:
+                sections.append(self._build_section(section_info["title"], content))
+            else:
+                missing.append((section_info, section_research))
+
+        # Write any section the batched answer left out on its own
+        if missing:
+            sections.extend(await asyncio.gather(*(
+                self._write_one_section(section_info, section_research, report_style)
+                for section_info, section_research in missing
+            )))
+
+        return sections
+
+    async def _research_one_section(
+        self,
+        run: _WorkflowRun,
+        section: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Run the research conversation for a single section"""
+        section_title = section["title"]
+        queries = section["queries"]
+
+        # The queries are known up front, so run the searches before the
+        # conversation instead of waiting for the agent to request them
+        search_results = await self.search_tools_wrapper.search_queries(queries)
+        sources = self._collect_sources(search_results)
+
+        # Keep the sources available to the writers' retrieve_sources tool
+        for source in sources:
+            run.pending_writes.append(asyncio.create_task(self.memory_manager.store_source(
+                source.get("title", ""),
+                source.get("content", ""),
+                source.get("url"),
+                source.get("source_type", "web")
+            )))
+
+        research_prompt = _RESEARCH_PROMPT_TEMPLATE.format(
+            section_title=section_title,
+            queries_bulleted="\n".join(f"- {query}" for query in queries),
+            search_results="\n".join(self._format_source(source) for source in sources) or "No results found."
+        )
+
+        # Execute research conversation; a dedicated proxy keeps concurrent
+        # chats with the shared research agent in separate histories
+        async with semaphore:
+            chat_result = await asyncio.to_thread(_run_chat, {
+                "sender": self._create_user_proxy(),
+                "recipient": self.research_agent,
+                "message": research_prompt,
+                "max_turns": 2,
+                "summary_method": "last_msg"
+            })
+
+        return {
+            "queries_executed": queries,
+            "chat_summary": chat_result[0].summary if chat_result else "",
+            "sources": sources
+        }
+
+    def _collect_sources(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Flatten search results into unique sources"""
+        sources = []
+        seen_urls = set()
+
+        for search_result in search_results:
+            for result in search_result.get("results", []):
+                url = result.get("url")
+                if url and url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                sources.append(result)
+
+        return sources
+
+    def _format_source(self, source: Dict[str, Any]) -> str:
+        """Render a search result for inclusion in a research prompt"""
+        content = (source.get("content") or "")[:500]
+        return f"- {source.get('title', '')} ({source.get('url') or 'no url'}): {content}"
+
+    async def _write_one_section(
+        self,
+        section_info: Dict[str, Any],
+        section_research: Dict[str, Any],
+        report_style: str
+    ) -> Dict[str, Any]:
+        """Run the writing conversation for a single section"""
+        section_title = section_info["title"]
+
+        writing_prompt = _SECTION_WRITING_PROMPT_TEMPLATE.format(
+            instructions=_SECTION_WRITING_INSTRUCTIONS_TEMPLATE.format(report_style=report_style),
+            section_brief=self._section_brief(section_info, section_research)
+        )
+
+        # Execute writing conversation; a dedicated proxy keeps concurrent
+        # chats with the shared writer agent in separate histories
+        summary = await self._cached_chat_summary("section_writing", {
+            "sender": self._create_user_proxy(),
+            "recipient": self.section_writer_agent,
+            "message": writing_prompt,
+            "max_turns": 4,
+            "summary_method": "last_msg"
+        })
+
+        return self._build_section(section_title, summary or f"Content for {section_title}")
+
+    def _section_brief(self, section_info: Dict[str, Any], section_research: Dict[str, Any]) -> str:
+        """Describe a section and its research for a writing prompt"""
+        return _SECTION_BRIEF_TEMPLATE.format(
+            section_title=section_info["title"],
+            queries_executed=section_research.get("queries_executed", []),
+            research_summary=section_research.get("chat_summary", "")
+        )
+
+    def _build_section(self, title: str, content: str) -> Dict[str, Any]:
+        """Create section object (simplified)"""
+        return {
+            "title": title,
+            "content": content,
+            "word_count": 800,  # Would calculate actual count
+            "citations": []  # Would extract from content
+        }
+
+    def _parse_json_object(self, text: str) -> Dict[str, Any]:
+        """Extract the outermost JSON object from an LLM response"""
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end <= start:
+            return {}
+
+        try:
+            parsed = json_codec.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+
+        return parsed if isinstance(parsed, dict) else {}
 
     async def _execute_final_phase(
         self,
         topic: str,
         sections: List[Dict[str, Any]],
+        research_data: Dict[str, Any],
         report_style: str
     ) -> Dict[str, Any]:
-        """Execute the final report assembly phase"""
+        """Assemble the final report from the written sections without another LLM pass"""
         try:
-            final_prompt = f"""
-            Compile the final research report for: "{topic}"
-
-            Sections to include:
-            {chr(10).join(f"- {section['title']}" for section in sections)}
-
-            Instructions:
-            1. Create an executive summary
-            2. Organize sections logically
-            3. Generate a comprehensive bibliography
-            4. Add proper formatting and metadata
-            5. Ensure consistent style throughout
-            6. Perform quality checks
-
-            Report style: {report_style}
-            Total sections: {len(sections)}
-            """
-
-            # Execute final assembly conversation
-            chat_result = initiate_chats([{
-                "sender": self.user_proxy,
-                "recipient": self.final_writer_agent,
-                "message": final_prompt,
-                "max_turns": 3,
-                "summary_method": "reflection_with_llm"
-            }])
+            total_sections = len(sections)
+
+            # The writers' output is already section-ready, so the executive
+            # summary is drawn from it rather than from a separate final chat
+            executive_summary = await asyncio.to_thread(
+                self.context_compressor.compress,
+                "\n".join(section["content"] for section in sections),
+                topic,
+                EXECUTIVE_SUMMARY_SENTENCES
+            )
 
             # Create final report structure
             final_report = {
                 "title": f"Research Report: {topic}",
-                "executive_summary": f"Executive summary for {topic} research report.",
+                "executive_summary": executive_summary or f"Executive summary for {topic} research report.",
                 "sections": sections,
-                "bibliography": [],  # Would be populated from citations
+                "bibliography": self._build_bibliography(research_data),
                 "metadata": {
                     "topic": topic,
                     "report_style": report_style,
-                    "total_sections": len(sections),
+                    "total_sections": total_sections,
+                    "executive_summary_method": "extractive",
                     "generated_by": "Athena Multi-Agent Research System"
                 }
             }
@@ -415,6 +774,46 @@ Deliver polished, professional reports that meet high standards.""",
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _build_bibliography(self, research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List the unique sources gathered across all sections"""
+        bibliography = []
+        seen = set()
+
+        for section_research in research_data.values():
+            for source in section_research.get("sources", []):
+                key = source.get("url") or source.get("title")
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                bibliography.append({
+                    "title": source.get("title", ""),
+                    "url": source.get("url"),
+                    "source_type": source.get("source_type", "web")
+                })
+
+        return bibliography
+
+    async def _cached_chat_summary(self, template_id: str, chat: Dict[str, Any]) -> str:
+        """Run a single-chat initiate_chats call, reusing cached summaries for identical prompts
+
+        Writing prompts open with the shared instructions and differ only in
+        the trailing research summary, which can fall outside the encoder's
+        window, so they are matched exactly rather than by similarity.
+        """
+        recipient = chat["recipient"]
+        model = recipient.llm_config["config_list"][0]["model"]
+
+        async def run_chat() -> str:
+            chat_result = await asyncio.to_thread(_run_chat, chat)
+            return chat_result[0].summary if chat_result else ""
+
+        return await self.prompt_cache.get_or_compute(
+            chat["message"],
+            run_chat,
+            namespace=(recipient.name, model, template_id),
+            exact=True
+        )
+
     async def refine_research(
         self,
         feedback: str,
@@ -426,9 +825,10 @@ Deliver polished, professional reports that meet high standards.""",
 
     async def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status"""
+        run = self._last_run
         return {
-            "current_plan": self.current_plan,
-            "research_progress": len(self.research_results),
-            "sections_completed": len(self.section_contents),
+            "current_plan": run.plan,
+            "research_progress": len(run.research_results),
+            "sections_completed": len(run.section_contents),
             "memory_stats": await self.memory_manager.get_memory_stats()
         }
\ No newline at end of file
@@ -1,9 +1,13 @@
 from .citation_manager import CitationManager, CitationStyle, Source
+from .context_compressor import ContextCompressor
 from .output_formatter import OutputFormatter
+from .semantic_cache import SemanticPromptCache
 
 __all__ = [
     "CitationManager",
     "CitationStyle",
     "Source",
-    "OutputFormatter"
+    "ContextCompressor",
+    "OutputFormatter",
+    "SemanticPromptCache"
 ]
\ No newline at end of file
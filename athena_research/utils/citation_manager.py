@@ -1,9 +1,28 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Pattern, Tuple
+from collections import Counter
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import io
 import re
 import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+@lru_cache(maxsize=32)
+def _compile_combined(prefixes: Tuple[str, ...]) -> Pattern:
+    """Compile one case-insensitive alternation of title prefixes, shared across instances"""
+    return re.compile(
+        '|'.join(f'(?P<g{i}>{re.escape(prefix)})' for i, prefix in enumerate(prefixes)),
+        re.IGNORECASE
+    )
 
 class CitationStyle(Enum):
     APA = "apa"
@@ -12,7 +31,7 @@ class CitationStyle(Enum):
     IEEE = "ieee"
     HARVARD = "harvard"
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     title: str
     url: Optional[str] = None
@@ -34,6 +53,37 @@ class CitationManager:
         self.sources = {}  # source_id -> Source
         self.citation_counter = 0
         self.inline_citations = {}  # text_location -> citation_id
+        self._inline_cache: Dict[str, str] = {}  # citation_id -> inline citation
+        self._biblio_cache: Dict[str, str] = {}  # citation_id -> bibliography entry
+        self._sort_keys: Dict[str, str] = {}  # citation_id -> bibliography sort key
+        self._citation_numbers: Dict[str, int] = {}  # citation_id -> citation number
+        self._today_str = datetime.now().strftime("%Y-%m-%d")
+        self._today_checked_at = time.monotonic()
+
+        # Resolve the style's formatters once; all take (source, citation_id)
+        self._inline_formatter = {
+            CitationStyle.APA: self._format_apa_inline,
+            CitationStyle.MLA: self._format_mla_inline,
+            CitationStyle.CHICAGO: self._format_chicago_inline,
+            CitationStyle.IEEE: self._format_ieee_inline,
+            CitationStyle.HARVARD: self._format_harvard_inline
+        }.get(style, self._format_default_inline)
+        self._biblio_formatter = {
+            CitationStyle.APA: self._format_apa_bibliography,
+            CitationStyle.MLA: self._format_mla_bibliography,
+            CitationStyle.CHICAGO: self._format_chicago_bibliography,
+            CitationStyle.IEEE: self._format_ieee_bibliography,
+            CitationStyle.HARVARD: self._format_harvard_bibliography
+        }.get(style, self._format_default_bibliography)
+
+    @property
+    def _today(self) -> str:
+        """Today's date for access dates, re-read at most once a minute"""
+        now = time.monotonic()
+        if now - self._today_checked_at >= 60:
+            self._today_str = datetime.now().strftime("%Y-%m-%d")
+            self._today_checked_at = now
+        return self._today_str
 
     def add_source(
         self,
@@ -53,7 +103,7 @@ class CitationManager:
         # Set access date for web sources
         access_date = kwargs.get('access_date')
         if source_type == "web" and not access_date:
-            access_date = datetime.now().strftime("%Y-%m-%d")
+            access_date = self._today
 
         source = Source(
             title=title,
@@ -70,64 +120,54 @@ class CitationManager:
         )
 
         self.sources[citation_id] = source
+        self._sort_keys[citation_id] = self._get_sort_key(source)
+        self._citation_numbers[citation_id] = self.citation_counter
+        self._inline_cache.pop(citation_id, None)
+        self._biblio_cache.pop(citation_id, None)
         return citation_id
 
     def get_inline_citation(self, citation_id: str) -> str:
         """Generate inline citation for the given source"""
+        if citation_id in self._inline_cache:
+            return self._inline_cache[citation_id]
+
         if citation_id not in self.sources:
             return f"[Unknown source: {citation_id}]"
 
-        source = self.sources[citation_id]
-
-        if self.style == CitationStyle.APA:
-            return self._format_apa_inline(source, citation_id)
-        elif self.style == CitationStyle.MLA:
-            return self._format_mla_inline(source, citation_id)
-        elif self.style == CitationStyle.CHICAGO:
-            return self._format_chicago_inline(source, citation_id)
-        elif self.style == CitationStyle.IEEE:
-            return self._format_ieee_inline(citation_id)
-        elif self.style == CitationStyle.HARVARD:
-            return self._format_harvard_inline(source, citation_id)
-        else:
-            return f"[{citation_id}]"
+        citation = self._inline_formatter(self.sources[citation_id], citation_id)
+        self._inline_cache[citation_id] = citation
+        return citation
 
     def get_bibliography_entry(self, citation_id: str) -> str:
         """Generate bibliography entry for the given source"""
+        if citation_id in self._biblio_cache:
+            return self._biblio_cache[citation_id]
+
         if citation_id not in self.sources:
             return f"Unknown source: {citation_id}"
 
-        source = self.sources[citation_id]
-
-        if self.style == CitationStyle.APA:
-            return self._format_apa_bibliography(source)
-        elif self.style == CitationStyle.MLA:
-            return self._format_mla_bibliography(source)
-        elif self.style == CitationStyle.CHICAGO:
-            return self._format_chicago_bibliography(source)
-        elif self.style == CitationStyle.IEEE:
-            return self._format_ieee_bibliography(source, citation_id)
-        elif self.style == CitationStyle.HARVARD:
-            return self._format_harvard_bibliography(source)
-        else:
-            return f"{source.title}. {source.url}"
+        entry = self._biblio_formatter(self.sources[citation_id], citation_id)
+        self._biblio_cache[citation_id] = entry
+        return entry
 
     def generate_bibliography(self) -> List[str]:
         """Generate complete bibliography sorted appropriately"""
-        entries = []
-
         if self.style == CitationStyle.IEEE:
             # IEEE uses numerical order
-            sorted_ids = sorted(self.sources.keys(), key=lambda x: int(x.split('_')[1]))
+            sorted_ids = sorted(self.sources.keys(), key=self._citation_numbers.__getitem__)
         else:
             # Most styles use alphabetical order by author/title
-            sorted_ids = sorted(
-                self.sources.keys(),
-                key=lambda x: self._get_sort_key(self.sources[x])
-            )
+            sorted_ids = sorted(self.sources.keys(), key=self._sort_keys.__getitem__)
+
+        # Format straight from the bound style formatter, reusing cached entries
+        cache = self._biblio_cache
+        formatter = self._biblio_formatter
+        entries = []
 
         for citation_id in sorted_ids:
-            entry = self.get_bibliography_entry(citation_id)
+            entry = cache.get(citation_id)
+            if entry is None:
+                entry = cache[citation_id] = formatter(self.sources[citation_id], citation_id)
             entries.append(entry)
 
         return entries
@@ -141,26 +181,20 @@ class CitationManager:
 
         if position is not None:
             # Insert at specific position
-            return text[:position] + inline_citation + text[position:]
+            return self._splice(text, [(position, inline_citation)])
         else:
             # Add at end of last sentence
-            # Find the last sentence ending
-            sentence_endings = ['.', '!', '?']
-            last_ending = -1
-
-            for ending in sentence_endings:
-                pos = text.rfind(ending)
-                if pos > last_ending:
-                    last_ending = pos
+            last_ending = max(text.rfind('.'), text.rfind('!'), text.rfind('?'))
 
             if last_ending != -1:
-                return text[:last_ending] + inline_citation + text[last_ending:]
+                return self._splice(text, [(last_ending, inline_citation)])
             else:
                 return text + " " + inline_citation
 
     def extract_and_cite_sources(self, content: str, sources_data: List[Dict[str, Any]]) -> str:
         """Extract sources from content and add citations"""
-        cited_content = content
+        # Title prefix (first 3 words) -> citation IDs of the sources sharing it
+        prefixes: Dict[str, List[str]] = {}
 
         for source_data in sources_data:
             # Add source to manager
@@ -176,30 +210,42 @@ class CitationManager:
             # Look for content that should be cited
             title_words = source_data.get('title', '').split()[:3]  # First 3 words
             if len(title_words) >= 2:
-                search_pattern = ' '.join(title_words)
-                if search_pattern.lower() in content.lower():
-                    # Add citation near this content
-                    pattern = re.compile(re.escape(search_pattern), re.IGNORECASE)
-                    matches = list(pattern.finditer(content))
-
-                    if matches:
-                        # Add citation after the first match
-                        match = matches[0]
-                        citation = self.get_inline_citation(citation_id)
-                        insert_pos = match.end()
-                        cited_content = (
-                            cited_content[:insert_pos] +
-                            citation +
-                            cited_content[insert_pos:]
-                        )
-
-        return cited_content
+                prefixes.setdefault(' '.join(title_words).lower(), []).append(citation_id)
+
+        if not prefixes:
+            return content
+
+        # Find every source's first mention in a single scan of the content
+        prefix_keys = tuple(sorted(prefixes))
+        pattern = _compile_combined(prefix_keys)
+        insertions = []
+
+        for match in pattern.finditer(content):
+            citation_ids = prefixes.pop(prefix_keys[int(match.lastgroup[1:])], None)
+            if citation_ids:
+                # Add citation after the first match
+                citation = ''.join(self.get_inline_citation(cid) for cid in citation_ids)
+                insertions.append((match.end(), citation))
+            if not prefixes:
+                break
+
+        return self._splice(content, insertions)
+
+    def _splice(self, text: str, insertions: List[Tuple[int, str]]) -> str:
+        """Insert strings at positions of the original text in a single pass"""
+        chunks = []
+        last = 0
+        for position, inserted in sorted(insertions, key=lambda insertion: insertion[0]):
+            chunks.append(text[last:position])
+            chunks.append(inserted)
+            last = position
+        chunks.append(text[last:])
+
+        return ''.join(chunks)
 
     def get_citation_summary(self) -> Dict[str, Any]:
         """Get summary of all citations"""
-        source_types = {}
-        for source in self.sources.values():
-            source_types[source.source_type] = source_types.get(source.source_type, 0) + 1
+        source_types = dict(Counter(source.source_type for source in self.sources.values()))
 
         return {
             "total_sources": len(self.sources),
@@ -218,7 +264,10 @@ class CitationManager:
     def export_citations(self, format_type: str = "json") -> str:
         """Export citations in specified format"""
         if format_type == "json":
-            return json.dumps(self.get_citation_summary(), indent=2)
+            summary = self.get_citation_summary()
+            if orjson is not None:
+                return orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode()
+            return json.dumps(summary, indent=2)
         elif format_type == "bibtex":
             return self._export_bibtex()
         elif format_type == "ris":
@@ -238,11 +287,10 @@ class CitationManager:
             year = self._extract_year(source.publication_date) if source.publication_date else "n.d."
             return f"({title_short}, {year})"
 
-    def _format_apa_bibliography(self, source: Source) -> str:
+    def _format_apa_bibliography(self, source: Source, citation_id: str = None) -> str:
         """Format APA bibliography entry"""
-        parts = []
-
         # Author
+        author_str = ""
         if source.authors:
             authors_formatted = []
             for author in source.authors:
@@ -254,64 +302,48 @@ class CitationManager:
                         last_name = name_parts[-1]
                         initials = '. '.join([n[0] for n in name_parts[:-1]]) + '.'
                         authors_formatted.append(f"{last_name}, {initials}")
-            parts.append(', '.join(authors_formatted))
+            author_str = f"{', '.join(authors_formatted)}. "
 
         # Year
         year = self._extract_year(source.publication_date) if source.publication_date else "n.d."
-        parts.append(f"({year})")
 
         # Title
-        if source.source_type in ['book', 'report']:
-            parts.append(f"*{source.title}*")
-        else:
-            parts.append(source.title)
+        title_str = f"*{source.title}*" if source.source_type in ['book', 'report'] else source.title
 
         # Publisher/URL
-        if source.publisher:
-            parts.append(source.publisher)
-        if source.url:
-            parts.append(f"Retrieved from {source.url}")
+        publisher_str = f". {source.publisher}" if source.publisher else ""
+        url_str = f". Retrieved from {source.url}" if source.url else ""
 
-        return '. '.join(parts) + '.'
+        return f"{author_str}({year}). {title_str}{publisher_str}{url_str}."
 
-    def _format_ieee_inline(self, citation_id: str) -> str:
+    def _format_ieee_inline(self, source: Source, citation_id: str) -> str:
         """Format IEEE inline citation (numerical)"""
-        number = citation_id.split('_')[1]
+        number = self._citation_numbers[citation_id]
         return f"[{number}]"
 
     def _format_ieee_bibliography(self, source: Source, citation_id: str) -> str:
         """Format IEEE bibliography entry"""
-        number = citation_id.split('_')[1]
-        parts = [f"[{number}]"]
+        number = self._citation_numbers[citation_id]
 
         # Authors
-        if source.authors:
-            if len(source.authors) == 1:
-                parts.append(source.authors[0])
-            else:
-                parts.append(', '.join(source.authors))
+        authors_str = f", {', '.join(source.authors)}" if source.authors else ""
 
         # Title
-        if source.source_type == 'book':
-            parts.append(f'*{source.title}*')
-        else:
-            parts.append(f'"{source.title}"')
+        title_str = f'*{source.title}*' if source.source_type == 'book' else f'"{source.title}"'
 
         # Publisher/URL
-        if source.publisher:
-            parts.append(source.publisher)
+        publisher_str = f", {source.publisher}" if source.publisher else ""
 
         # Date
-        if source.publication_date:
-            year = self._extract_year(source.publication_date)
-            parts.append(year)
+        year_str = f", {self._extract_year(source.publication_date)}" if source.publication_date else ""
 
         # URL
+        url_str = ""
         if source.url:
-            access_date = source.access_date or datetime.now().strftime("%Y-%m-%d")
-            parts.append(f"[Online]. Available: {source.url}. [Accessed: {access_date}]")
+            access_date = source.access_date or self._today
+            url_str = f", [Online]. Available: {source.url}. [Accessed: {access_date}]"
 
-        return ', '.join(parts) + '.'
+        return f"[{number}]{authors_str}, {title_str}{publisher_str}{year_str}{url_str}."
 
     def _format_mla_inline(self, source: Source, citation_id: str) -> str:
         """Format MLA inline citation"""
@@ -325,41 +357,29 @@ class CitationManager:
             title_short = source.title.split()[0] if source.title else "Unknown"
             return f"({title_short})"
 
-    def _format_mla_bibliography(self, source: Source) -> str:
+    def _format_mla_bibliography(self, source: Source, citation_id: str = None) -> str:
         """Format MLA bibliography entry"""
-        parts = []
-
         # Author
-        if source.authors:
-            parts.append(source.authors[0])  # MLA uses first author only in works cited
+        author_str = f"{source.authors[0]}, " if source.authors else ""  # MLA uses first author only in works cited
 
         # Title
-        if source.source_type in ['book']:
-            parts.append(f"*{source.title}*")
-        else:
-            parts.append(f'"{source.title}"')
+        title_str = f"*{source.title}*" if source.source_type in ['book'] else f'"{source.title}"'
 
         # Publisher and date
-        if source.publisher:
-            parts.append(source.publisher)
-
-        if source.publication_date:
-            year = self._extract_year(source.publication_date)
-            parts.append(year)
+        publisher_str = f", {source.publisher}" if source.publisher else ""
+        year_str = f", {self._extract_year(source.publication_date)}" if source.publication_date else ""
 
         # URL and access date for web sources
-        if source.url and source.source_type == 'web':
-            parts.append(f"Web. {source.access_date}")
-            parts.append(source.url)
+        url_str = f", Web. {source.access_date}, {source.url}" if source.url and source.source_type == 'web' else ""
 
-        return ', '.join(parts) + '.'
+        return f"{author_str}{title_str}{publisher_str}{year_str}{url_str}."
 
     def _format_chicago_inline(self, source: Source, citation_id: str) -> str:
         """Format Chicago inline citation"""
-        number = citation_id.split('_')[1]
+        number = self._citation_numbers[citation_id]
         return f"^{number}"
 
-    def _format_chicago_bibliography(self, source: Source) -> str:
+    def _format_chicago_bibliography(self, source: Source, citation_id: str = None) -> str:
         """Format Chicago bibliography entry"""
         # Similar to APA but with different punctuation
         return self._format_apa_bibliography(source)
@@ -368,17 +388,25 @@ class CitationManager:
         """Format Harvard inline citation"""
         return self._format_apa_inline(source, citation_id)  # Very similar to APA
 
-    def _format_harvard_bibliography(self, source: Source) -> str:
+    def _format_harvard_bibliography(self, source: Source, citation_id: str = None) -> str:
         """Format Harvard bibliography entry"""
         return self._format_apa_bibliography(source)  # Very similar to APA
 
+    def _format_default_inline(self, source: Source, citation_id: str) -> str:
+        """Format inline citation for styles without a dedicated formatter"""
+        return f"[{citation_id}]"
+
+    def _format_default_bibliography(self, source: Source, citation_id: str) -> str:
+        """Format bibliography entry for styles without a dedicated formatter"""
+        return f"{source.title}. {source.url}"
+
     def _extract_year(self, date_string: str) -> str:
         """Extract year from date string"""
         if not date_string:
             return "n.d."
 
         # Try to extract 4-digit year
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_string)
+        year_match = _YEAR_RE.search(date_string)
         if year_match:
             return year_match.group()
 
@@ -387,75 +415,58 @@ class CitationManager:
     def _get_sort_key(self, source: Source) -> str:
         """Get sorting key for bibliography"""
         if source.authors:
-            return source.authors[0].lower()
+            return source.authors[0].casefold()
         else:
-            return source.title.lower()
+            return source.title.casefold()
 
     def _export_bibtex(self) -> str:
         """Export citations in BibTeX format"""
-        bibtex_entries = []
+        buffer = io.StringIO()
 
-        for citation_id, source in self.sources.items():
+        for index, (citation_id, source) in enumerate(self.sources.items()):
             entry_type = "article" if source.source_type in ["web", "news"] else "book"
 
-            bibtex_entry = f"@{entry_type}{{{citation_id},\n"
-            bibtex_entry += f"  title={{{source.title}}},\n"
+            # Entries are separated by a blank line
+            if index:
+                buffer.write("\n")
 
+            buffer.write(f"@{entry_type}{{{citation_id},\n  title={{{source.title}}},\n")
             if source.authors:
-                bibtex_entry += f"  author={{{' and '.join(source.authors)}}},\n"
-
+                buffer.write(f"  author={{{' and '.join(source.authors)}}},\n")
             if source.publication_date:
-                year = self._extract_year(source.publication_date)
-                bibtex_entry += f"  year={{{year}}},\n"
-
+                buffer.write(f"  year={{{self._extract_year(source.publication_date)}}},\n")
             if source.url:
-                bibtex_entry += f"  url={{{source.url}}},\n"
-
+                buffer.write(f"  url={{{source.url}}},\n")
             if source.publisher:
-                bibtex_entry += f"  publisher={{{source.publisher}}},\n"
-
-            bibtex_entry += "}\n"
-            bibtex_entries.append(bibtex_entry)
+                buffer.write(f"  publisher={{{source.publisher}}},\n")
+            buffer.write("}\n")
 
-        return "\n".join(bibtex_entries)
+        return buffer.getvalue()
 
     def _export_ris(self) -> str:
         """Export citations in RIS format"""
-        ris_entries = []
+        buffer = io.StringIO()
 
-        for citation_id, source in self.sources.items():
-            ris_entry = []
+        for index, source in enumerate(self.sources.values()):
+            # Records are separated by a blank line
+            if index:
+                buffer.write("\n\n")
 
-            # Type
-            if source.source_type == "book":
-                ris_entry.append("TY  - BOOK")
-            else:
-                ris_entry.append("TY  - ELEC")
+            # Type and title
+            entry_type = "BOOK" if source.source_type == "book" else "ELEC"
+            buffer.write(f"TY  - {entry_type}\nTI  - {source.title}\n")
 
-            # Title
-            ris_entry.append(f"TI  - {source.title}")
-
-            # Authors
-            if source.authors:
-                for author in source.authors:
-                    ris_entry.append(f"AU  - {author}")
-
-            # Year
+            # Optional fields, one line each
+            for author in source.authors or []:
+                buffer.write(f"AU  - {author}\n")
             if source.publication_date:
-                year = self._extract_year(source.publication_date)
-                ris_entry.append(f"PY  - {year}")
-
-            # URL
+                buffer.write(f"PY  - {self._extract_year(source.publication_date)}\n")
             if source.url:
-                ris_entry.append(f"UR  - {source.url}")
-
-            # Publisher
+                buffer.write(f"UR  - {source.url}\n")
             if source.publisher:
-                ris_entry.append(f"PB  - {source.publisher}")
+                buffer.write(f"PB  - {source.publisher}\n")
 
             # End of record
-            ris_entry.append("ER  - ")
-
-            ris_entries.append("\n".join(ris_entry))
+            buffer.write("ER  - ")
 
-        return "\n\n".join(ris_entries)
\ No newline at end of file
+        return buffer.getvalue()
@@ -0,0 +1,97 @@
+from typing import Any, List, Optional
+from collections import Counter
+import math
+import re
+import numpy as np
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+_MARKDOWN_PREFIX = re.compile(r'^(?:#+|[-*+>]|\d+[.)])\s+')
+_WORD = re.compile(r'[a-z0-9]+')
+
+class ContextCompressor:
+    """Shrinks research context before it is forwarded to writer prompts.
+
+    Markdown and agent boilerplate is stripped, near-duplicate sentences are
+    dropped by embedding similarity, and the remaining sentences are ranked
+    by TF-IDF overlap with a query, keeping the best ones in original order.
+    """
+
+    def __init__(
+        self,
+        encoder: Optional[Any] = None,
+        max_sentences: int = 12,
+        similarity_threshold: float = 0.9
+    ):
+        self.encoder = encoder
+        self.max_sentences = max_sentences
+        self.similarity_threshold = similarity_threshold
+
+    def compress(self, text: str, query: str, max_sentences: Optional[int] = None) -> str:
+        """Compress text to the sentences most relevant to the query"""
+        max_sentences = max_sentences or self.max_sentences
+        sentences = self._split_sentences(text)
+        if not sentences:
+            return ""
+
+        sentences = self._deduplicate(sentences)
+        if len(sentences) > max_sentences:
+            scores = self._tfidf_scores(sentences, query)
+            best = sorted(range(len(sentences)), key=lambda i: -scores[i])[:max_sentences]
+            sentences = [sentences[i] for i in sorted(best)]
+
+        return " ".join(sentences)
+
+    def _split_sentences(self, text: str) -> List[str]:
+        sentences = []
+
+        for sentence in _SENTENCE_BOUNDARY.split(text or ""):
+            sentence = _MARKDOWN_PREFIX.sub("", sentence.strip()).replace("**", "").strip()
+            # Skip conversation terminators and fragments without content
+            if sentence and sentence != "TERMINATE" and _WORD.search(sentence.lower()):
+                sentences.append(sentence)
+
+        return sentences
+
+    def _deduplicate(self, sentences: List[str]) -> List[str]:
+        if self.encoder is None:
+            seen = set()
+            unique = []
+            for sentence in sentences:
+                key = " ".join(_WORD.findall(sentence.lower()))
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(sentence)
+            return unique
+
+        embeddings = np.asarray(self.encoder.encode(
+            sentences,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ))
+
+        kept = []
+        for i in range(len(sentences)):
+            if not kept or float(np.max(embeddings[kept] @ embeddings[i])) < self.similarity_threshold:
+                kept.append(i)
+
+        return [sentences[i] for i in kept]
+
+    def _tfidf_scores(self, sentences: List[str], query: str) -> List[float]:
+        tokenized = [_WORD.findall(sentence.lower()) for sentence in sentences]
+        query_terms = set(_WORD.findall(query.lower()))
+
+        document_frequency = Counter(term for tokens in tokenized for term in set(tokens))
+        total = len(tokenized)
+
+        scores = []
+        for tokens in tokenized:
+            counts = Counter(tokens)
+            score = sum(
+                counts[term] * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+                for term in query_terms
+                if term in counts
+            )
+            scores.append(score / math.sqrt(len(tokens)) if tokens else 0.0)
+
+        return scores
@@ -1,12 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
+import functools
 from ..config import settings
 
-try:
-    from openai import AsyncAzureOpenAI
-except ImportError:
-    AsyncAzureOpenAI = None
+# Prompt label per chat role; messages with other roles are left out
+_ROLE_LABELS = {"system": "System", "user": "User", "assistant": "Assistant"}
 
 class BaseLLMClient(ABC):
     @abstractmethod
@@ -20,7 +18,15 @@ class BaseLLMClient(ABC):
 
 class GeminiClient(BaseLLMClient):
     def __init__(self):
+        # Imported here so other providers don't pay for loading the Gemini SDK
+        import google.generativeai as genai
+
         genai.configure(api_key=settings.gemini_api_key)
+        self._genai = genai
+
+        # Model objects and generation configs are reused across requests
+        self._models: Dict[str, Any] = {}
+        self._generation_config = functools.lru_cache(maxsize=32)(self._build_generation_config)
 
     async def generate_response(
         self,
@@ -32,14 +38,13 @@ class GeminiClient(BaseLLMClient):
         # Convert messages to Gemini format
         prompt = self._convert_messages_to_prompt(messages)
 
-        # Create the model
-        gemini_model = genai.GenerativeModel(model)
+        # Get the model
+        gemini_model = self._models.get(model)
+        if gemini_model is None:
+            gemini_model = self._models[model] = self._genai.GenerativeModel(model)
 
         # Configure generation parameters
-        generation_config = genai.types.GenerationConfig(
-            temperature=temperature,
-            max_output_tokens=max_tokens,
-        )
+        generation_config = self._generation_config(temperature, max_tokens)
 
         # Generate response
         response = await gemini_model.generate_content_async(
@@ -49,31 +54,41 @@ class GeminiClient(BaseLLMClient):
 
         return response.text
 
+    def _build_generation_config(self, temperature: float, max_tokens: int) -> Any:
+        return self._genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+
     def _convert_messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         # Convert OpenAI-style messages to a single prompt for Gemini
-        prompt_parts = []
-        for message in messages:
-            role = message.get("role", "user")
-            content = message.get("content", "")
-
-            if role == "system":
-                prompt_parts.append(f"System: {content}")
-            elif role == "user":
-                prompt_parts.append(f"User: {content}")
-            elif role == "assistant":
-                prompt_parts.append(f"Assistant: {content}")
-
-        return "\n\n".join(prompt_parts)
+        return "\n\n".join(
+            f"{_ROLE_LABELS[message.get('role', 'user')]}: {message.get('content', '')}"
+            for message in messages
+            if message.get("role", "user") in _ROLE_LABELS
+        )
 
 class AzureOpenAIClient(BaseLLMClient):
+    # One SDK client, and so one connection pool, shared by every instance
+    _shared_client = None
+
     def __init__(self):
-        if AsyncAzureOpenAI is None:
-            raise ImportError("OpenAI package not installed. Install with: pip install openai")
-        self.client = AsyncAzureOpenAI(
-            api_key=settings.azure_openai_api_key,
-            api_version=settings.azure_openai_api_version,
-            azure_endpoint=settings.azure_openai_endpoint
-        )
+        self.client = self._get_shared_client()
+
+    @classmethod
+    def _get_shared_client(cls):
+        if cls._shared_client is None:
+            try:
+                from openai import AsyncAzureOpenAI
+            except ImportError:
+                raise ImportError("OpenAI package not installed. Install with: pip install openai")
+
+            cls._shared_client = AsyncAzureOpenAI(
+                api_key=settings.azure_openai_api_key,
+                api_version=settings.azure_openai_api_version,
+                azure_endpoint=settings.azure_openai_endpoint
+            )
+        return cls._shared_client
 
     async def generate_response(
         self,
@@ -96,15 +111,22 @@ class AzureOpenAIClient(BaseLLMClient):
 
 class LLMClientFactory:
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_client() -> BaseLLMClient:
         if settings.llm_provider == "gemini":
             return GeminiClient()
         elif settings.llm_provider == "azure_openai":
-            if AsyncAzureOpenAI is None:
-                raise ImportError("OpenAI package not installed. Install with: pip install openai")
             return AzureOpenAIClient()
         else:
             raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
 
-# Global client instance
-llm_client = LLMClientFactory.create_client()
\ No newline at end of file
+def get_client() -> BaseLLMClient:
+    """Get the shared client for the configured provider, created on first use"""
+    return LLMClientFactory.create_client()
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from .llm_client import llm_client` working without creating
+    # the client at import time
+    if name == "llm_client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,144 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import hashlib
+import numpy as np
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+class SemanticPromptCache:
+    """Caches LLM conversation summaries keyed by prompt embedding similarity.
+
+    Entries are partitioned by an exact namespace (e.g. agent name, model and
+    prompt template id); within a namespace a cached summary is reused when
+    the new prompt's cosine similarity to a stored prompt reaches
+    ``similarity_threshold``. Prompts whose meaningful part can fall beyond
+    the encoder's input window are cached with ``exact=True`` instead, keyed
+    by a hash of the whole prompt.
+    """
+
+    def __init__(
+        self,
+        encoder: Optional[Any] = None,
+        similarity_threshold: float = 0.995,
+        max_entries: int = 1024
+    ):
+        self.encoder = encoder
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._indexes: Dict[Hashable, Any] = {}
+        self._values: Dict[Hashable, List[str]] = {}
+        self._exact_values: Dict[Tuple[Hashable, bytes], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self,
+        prompt: str,
+        compute: Callable[[], Awaitable[str]],
+        namespace: Hashable = None,
+        exact: bool = False
+    ) -> str:
+        """Return a cached summary for a near-identical prompt, or compute and cache it
+
+        With exact, only an identical prompt in the same namespace is a hit.
+        """
+        if exact:
+            return await self._get_or_compute_exact(prompt, compute, namespace)
+
+        try:
+            embedding = await asyncio.to_thread(self._embed, prompt)
+        except Exception as e:
+            print(f"Semantic cache unavailable: {e}")
+            return await compute()
+
+        cached, similarity = self._lookup(namespace, embedding)
+        if cached is not None and similarity >= self.similarity_threshold:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        value = await compute()
+        if value:
+            self._insert(namespace, embedding, value)
+        return value
+
+    async def _get_or_compute_exact(
+        self,
+        prompt: str,
+        compute: Callable[[], Awaitable[str]],
+        namespace: Hashable
+    ) -> str:
+        key = (namespace, hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest())
+        cached = self._exact_values.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        value = await compute()
+        if value and len(self._exact_values) < self.max_entries:
+            self._exact_values[key] = value
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": sum(len(values) for values in self._values.values()) + len(self._exact_values),
+            "similarity_threshold": self.similarity_threshold
+        }
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._indexes.clear()
+        self._values.clear()
+        self._exact_values.clear()
+
+    def _embed(self, text: str) -> np.ndarray:
+        if self.encoder is None:
+            from sentence_transformers import SentenceTransformer
+            self.encoder = SentenceTransformer('all-MiniLM-L6-v2')
+
+        embedding = self.encoder.encode(
+            [text],
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return np.ascontiguousarray(embedding, dtype=np.float32)
+
+    def _lookup(self, namespace: Hashable, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        index = self._indexes.get(namespace)
+        if index is None:
+            return None, 0.0
+
+        if faiss is not None:
+            if index.ntotal == 0:
+                return None, 0.0
+            scores, positions = index.search(embedding, 1)
+            return self._values[namespace][positions[0][0]], float(scores[0][0])
+
+        # Without FAISS, the index is a plain matrix of normalized embeddings
+        scores = index @ embedding[0]
+        best = int(np.argmax(scores))
+        return self._values[namespace][best], float(scores[best])
+
+    def _insert(self, namespace: Hashable, embedding: np.ndarray, value: str):
+        values = self._values.setdefault(namespace, [])
+        if len(values) >= self.max_entries:
+            return
+
+        if faiss is not None:
+            index = self._indexes.get(namespace)
+            if index is None:
+                index = self._indexes[namespace] = faiss.IndexFlatIP(embedding.shape[1])
+            index.add(embedding)
+        else:
+            index = self._indexes.get(namespace)
+            self._indexes[namespace] = embedding if index is None else np.vstack([index, embedding])
+
+        values.append(value)
@@ -1,12 +1,8 @@
 """
 Quick demo of Athena Interactive Chat System
 """
-import asyncio
-import subprocess
-import sys
-import time
 
-async def demo_athena():
+def demo_athena():
     """Demonstrate Athena's capabilities"""
     print("ATHENA INTERACTIVE CHAT SYSTEM DEMO")
     print("=" * 50)
@@ -57,7 +53,7 @@ async def demo_athena():
     print("sessions/")
     print("  abc12345/")
     print("    session.json              # Conversation history")
-    print("    research_20240925_143022.md  # Research reports")
+    print("    research_20240925_143022_<topic>_<id>.md  # Research reports")
     print()
 
     print("Available Commands:")
@@ -89,7 +85,7 @@ async def demo_athena():
 
 def main():
     """Run demo"""
-    asyncio.run(demo_athena())
+    demo_athena()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
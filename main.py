@@ -3,38 +3,171 @@ Athena AI Research System - Interactive Chat Interface
 Main entry point for conversational research with session management
 """
 import asyncio
+import functools
 import os
 import json
 import uuid
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 import google.generativeai as genai
 from tavily import TavilyClient
+from athena_core import AthenaCache, cached_generate, report_filename, run_research
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 load_dotenv('athena_research/.env')
 
+WELCOME_MSG = """
+ATHENA AI RESEARCH SYSTEM
+
+I'm your AI research assistant powered by:
+- Gemini Flash for intelligent analysis
+- Tavily for real-time web search
+- Session memory for continuous conversations
+
+How can I help you research today?
+
+Commands:
+- Type your question normally for research
+- '/help' - Show available commands
+- '/history' - View conversation history
+- '/research <topic>' - Deep research mode
+- '/quick <topic>' - Quick research summary
+- '/sessions' - List all sessions
+- '/load <session_id>' - Load previous session
+- '/exit' - End session
+"""
+
+HELP_TEXT = """
+[Help] Athena Commands:
+
+Research Commands:
+* /research <topic>    - Deep research with sources and analysis
+* /quick <topic>       - Quick research summary
+
+Session Commands:
+* /sessions            - List all available sessions
+* /load <session_id>   - Load a previous session
+* /history [limit]     - Show conversation history
+* /save               - Manually save current session
+
+Utility Commands:
+* /help               - Show this help message
+* /clear              - Clear screen (conversation stays saved)
+* /exit               - End current session
+
+Examples:
+* /research artificial intelligence in healthcare
+* /quick quantum computing
+* /load ab12cd34
+"""
+
+# Number of assistant replies between rolling summary updates
+SUMMARY_INTERVAL = 5
+
+# Formatted turns kept ready for prompt context
+CONTEXT_TAIL_SIZE = 20
+
+# Messages kept in memory; older ones are read back from the session log
+HISTORY_LIMIT = 200
+
+# Static instructions go in the system prompt so the cacheable prefix stays stable across turns
+ATHENA_SYSTEM_PROMPT = "You are Athena, an AI research assistant powered by Gemini and real-time web search."
+
+CHAT_SYSTEM_PROMPT = ATHENA_SYSTEM_PROMPT + """
+Respond to the user's message in a helpful, conversational way.
+
+Guidelines:
+- Be conversational and helpful
+- If they ask about research topics, offer to do deep research with /research command
+- Reference previous conversation when relevant
+- Keep responses concise but informative
+- Suggest specific next steps when appropriate
+"""
+
+def dump_json(data) -> bytes:
+    """Serialize session data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, default=datetime.isoformat, separators=(',', ':')).encode('utf-8')
+
+def write_atomic(path: Path, data: bytes):
+    """Write a file through a temporary sibling so readers never see a partial file"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def print_stream(text: str):
+    """Print a streamed response chunk without a trailing newline"""
+    print(text, end="", flush=True)
+
+def load_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=None)
+def get_model(system_instruction: str):
+    """Shared Gemini model for a system prompt, created once per process"""
+    genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
+    return genai.GenerativeModel('gemini-1.5-flash', system_instruction=system_instruction)
+
+@functools.lru_cache(maxsize=1)
+def get_search_client() -> TavilyClient:
+    """Shared Tavily client so its HTTP connections are reused across sessions"""
+    return TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+
 class AthenaSession:
     """Manages individual chat sessions with conversation history"""
 
     def __init__(self, session_id: str = None):
         self.session_id = session_id or str(uuid.uuid4())[:8]
         self.created_at = datetime.now()
-        self.conversation_history: List[Dict] = []
+        self.conversation_history: deque = deque(maxlen=HISTORY_LIMIT)
+        self.message_count = 0
         self.research_history: List[Dict] = []
+        self._formatted_tail: deque = deque(maxlen=CONTEXT_TAIL_SIZE)
+        self.summary = ""
+        self.summary_upto = 0
+        self._replies_since_summary = 0
+        self._summary_task: Optional[asyncio.Task] = None
+        self._dirty = True
         self.session_dir = Path(f"sessions/{self.session_id}")
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
-        # Configure AI services
-        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
-        self.search_client = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+        # Messages are appended to an unbuffered log; session.json is only a checkpoint
+        self._log_file = open(self.session_dir / 'session.jsonl', 'ab', buffering=0)
 
         print(f"[Athena] Session {self.session_id} initialized")
         print(f"[Data] Session saved to: {self.session_dir}")
 
+    @property
+    def model(self):
+        """Gemini model for research prompts"""
+        return get_model(ATHENA_SYSTEM_PROMPT)
+
+    @property
+    def chat_model(self):
+        """Gemini model for conversational replies"""
+        return get_model(CHAT_SYSTEM_PROMPT)
+
+    @property
+    def search_client(self) -> TavilyClient:
+        """Tavily web search client"""
+        return get_search_client()
+
     def add_message(self, role: str, content: str, metadata: Dict = None):
         """Add message to conversation history"""
         message = {
@@ -44,50 +177,185 @@ class AthenaSession:
             'metadata': metadata or {}
         }
         self.conversation_history.append(message)
-        self.save_session()
+        self.message_count += 1
+        self._dirty = True
+        self._log_file.write(dump_json(message) + b'\n')
+
+        formatted = self._format_message(message)
+        if formatted:
+            self._formatted_tail.append(formatted)
+
+        if role == 'assistant':
+            self._replies_since_summary += 1
+            if self._replies_since_summary >= SUMMARY_INTERVAL:
+                self._schedule_summary()
+
+    def _schedule_summary(self):
+        """Refresh the rolling summary in the background"""
+        if self._summary_task and not self._summary_task.done():
+            return
+        try:
+            self._summary_task = asyncio.get_running_loop().create_task(self._resummarize())
+            self._replies_since_summary = 0
+        except RuntimeError:
+            # No event loop yet; retry on the next reply
+            pass
+
+    async def _resummarize(self):
+        """Fold the turns since the last summary into the rolling summary"""
+        upto = self.message_count
+        new_turns = self._format_messages(self.get_messages(self.summary_upto, upto))
+        prompt = f"""
+        Condense the following into 200 words preserving facts:
+
+        {self.summary}
+
+        {new_turns}
+        """
+
+        try:
+            response = await self.model.generate_content_async(prompt)
+            self.summary = response.text
+            self.summary_upto = upto
+            self._dirty = True
+        except Exception as e:
+            print(f"[Warning] Conversation summary update failed: {e}")
+
+    def add_research(self, research_data: Dict):
+        """Record a completed research run"""
+        self.research_history.append(research_data)
+        self._dirty = True
+
+    def close(self):
+        """Close the message log; save_session first to keep the checkpoint current"""
+        self._log_file.close()
+
+    def __enter__(self) -> 'AthenaSession':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def save_session(self):
-        """Save session data to file"""
+        """Checkpoint the full session state to file, skipping it when nothing changed"""
+        if not self._dirty:
+            return
+
         session_data = {
             'session_id': self.session_id,
-            'created_at': self.created_at.isoformat(),
-            'conversation_history': self.conversation_history,
-            'research_history': self.research_history
+            'created_at': self.created_at,
+            'message_count': self.message_count,
+            'conversation_history': list(self.conversation_history),
+            'research_history': self.research_history,
+            'summary': self.summary,
+            'summary_upto': self.summary_upto
         }
 
-        with open(self.session_dir / 'session.json', 'w') as f:
-            json.dump(session_data, f, indent=2)
+        write_atomic(self.session_dir / 'session.json', dump_json(session_data))
+
+        # Small index record so listing sessions never parses full histories
+        meta = {
+            'id': self.session_id,
+            'created_at': self.created_at,
+            'message_count': self.message_count
+        }
+        write_atomic(self.session_dir / 'meta.json', dump_json(meta))
+        self._dirty = False
 
     @classmethod
     def load_session(cls, session_id: str) -> 'AthenaSession':
         """Load existing session"""
         session_dir = Path(f"sessions/{session_id}")
-        if not (session_dir / 'session.json').exists():
+        checkpoint_file = session_dir / 'session.json'
+        log_file = session_dir / 'session.jsonl'
+        if not checkpoint_file.exists() and not log_file.exists():
             raise FileNotFoundError(f"Session {session_id} not found")
 
-        with open(session_dir / 'session.json', 'r') as f:
-            data = json.load(f)
+        data = {}
+        if checkpoint_file.exists():
+            data = load_json(checkpoint_file.read_bytes())
 
         session = cls(session_id)
-        session.created_at = datetime.fromisoformat(data['created_at'])
-        session.conversation_history = data.get('conversation_history', [])
+        if 'created_at' in data:
+            session.created_at = datetime.fromisoformat(data['created_at'])
+
+        # The message log is authoritative; older sessions only have the checkpoint
+        try:
+            if log_file.stat().st_size:
+                with open(log_file, 'rb') as f:
+                    for line in f:
+                        session.conversation_history.append(load_json(line))
+                        session.message_count += 1
+            else:
+                messages = data.get('conversation_history', [])
+                session.conversation_history.extend(messages)
+                session.message_count = len(messages)
+                session._log_file.write(b''.join(dump_json(message) + b'\n' for message in messages))
+        except Exception:
+            session.close()
+            raise
+
+        session._formatted_tail.extend(filter(None, map(cls._format_message, session.conversation_history)))
         session.research_history = data.get('research_history', [])
+        session.summary = data.get('summary', "")
+        session.summary_upto = data.get('summary_upto', 0)
+        # Only legacy sessions without meta.json need a fresh checkpoint
+        session._dirty = not (session_dir / 'meta.json').exists()
 
-        print(f"[Load] Session {session_id} loaded with {len(session.conversation_history)} messages")
+        print(f"[Load] Session {session_id} loaded with {session.message_count} messages")
         return session
 
-    def get_conversation_context(self, limit: int = 10) -> str:
-        """Get recent conversation context for AI"""
-        recent_messages = self.conversation_history[-limit:]
-        context = []
+    def get_messages(self, start: int, end: int) -> List[Dict]:
+        """Get messages by position, reading ones no longer in memory from the session log"""
+        first_in_memory = self.message_count - len(self.conversation_history)
+        if start >= first_in_memory:
+            return list(islice(self.conversation_history, start - first_in_memory, end - first_in_memory))
+
+        with open(self.session_dir / 'session.jsonl', 'rb') as f:
+            return [load_json(line) for line in islice(f, start, end)]
 
-        for msg in recent_messages:
-            if msg['role'] == 'user':
-                context.append(f"User: {msg['content']}")
-            elif msg['role'] == 'assistant':
-                context.append(f"Athena: {msg['content']}")
+    @staticmethod
+    def _format_message(msg: Dict) -> Optional[str]:
+        """Render a user or assistant message as a transcript line"""
+        if msg['role'] == 'user':
+            return f"User: {msg['content']}"
+        elif msg['role'] == 'assistant':
+            return f"Athena: {msg['content']}"
+        return None
+
+    @classmethod
+    def _format_messages(cls, messages: List[Dict]) -> str:
+        """Render user and assistant messages as a transcript"""
+        return "\n".join(filter(None, map(cls._format_message, messages)))
+
+    def get_conversation_context(self, limit: int = 10) -> str:
+        """Get the rolling summary plus recent conversation for AI"""
+        tail = self._formatted_tail
+        recent = "\n".join(islice(tail, max(0, len(tail) - limit), None))
+        if not self.summary:
+            return recent
+        return f"Summary so far:\n{self.summary}\n\nRecent turns:\n{recent}"
+
+    def get_chat_history(self, limit: int = 10) -> List[Dict]:
+        """Get recent conversation as Gemini content turns"""
+        history = []
+        if self.summary:
+            history.append({'role': 'user', 'parts': [f"Summary of our earlier conversation:\n{self.summary}"]})
+
+        for msg in self.get_messages(max(0, self.message_count - limit), self.message_count):
+            if msg['role'] not in ('user', 'assistant'):
+                continue
+            role = 'user' if msg['role'] == 'user' else 'model'
+            # Gemini contents must open with a user turn
+            if not history and role == 'model':
+                continue
+            # Consecutive turns from the same side are merged into one content
+            if history and history[-1]['role'] == role:
+                history[-1]['parts'].append(msg['content'])
+            else:
+                history.append({'role': role, 'parts': [msg['content']]})
 
-        return "\n".join(context)
+        return history
 
 class AthenaChat:
     """Main chat interface for Athena AI Research System"""
@@ -96,40 +364,32 @@ class AthenaChat:
         self.current_session: Optional[AthenaSession] = None
         self.sessions_dir = Path("sessions")
         self.sessions_dir.mkdir(exist_ok=True)
+        self.response_cache = AthenaCache(self.sessions_dir / "response_cache.db")
 
-    async def start_new_session(self) -> AthenaSession:
-        """Start a new chat session"""
-        self.current_session = AthenaSession()
-
-        welcome_msg = """
-ATHENA AI RESEARCH SYSTEM
-
-I'm your AI research assistant powered by:
-- Gemini Flash for intelligent analysis
-- Tavily for real-time web search
-- Session memory for continuous conversations
+    def _set_session(self, session: Optional[AthenaSession]):
+        """Make a session current, saving and closing the one it replaces"""
+        if self.current_session is not None and self.current_session is not session:
+            self.current_session.save_session()
+            self.current_session.close()
+        self.current_session = session
 
-How can I help you research today?
+    def close(self):
+        """Save and close the current session and the response cache"""
+        self._set_session(None)
+        self.response_cache.close()
 
-Commands:
-- Type your question normally for research
-- '/help' - Show available commands
-- '/history' - View conversation history
-- '/research <topic>' - Deep research mode
-- '/quick <topic>' - Quick research summary
-- '/sessions' - List all sessions
-- '/load <session_id>' - Load previous session
-- '/exit' - End session
-"""
+    async def start_new_session(self) -> AthenaSession:
+        """Start a new chat session"""
+        self._set_session(AthenaSession())
 
-        print(welcome_msg)
-        self.current_session.add_message('system', welcome_msg.strip())
+        print(WELCOME_MSG)
+        self.current_session.save_session()
         return self.current_session
 
     async def load_session(self, session_id: str) -> AthenaSession:
         """Load existing session"""
         try:
-            self.current_session = AthenaSession.load_session(session_id)
+            self._set_session(AthenaSession.load_session(session_id))
             print(f"[OK] Session {session_id} loaded successfully")
             print("[History] Recent conversation:")
             await self.show_history(limit=3)
@@ -142,14 +402,24 @@ Commands:
         """List all available sessions"""
         sessions = []
         for session_dir in self.sessions_dir.glob("*/"):
-            if (session_dir / "session.json").exists():
-                with open(session_dir / "session.json", 'r') as f:
-                    data = json.load(f)
-                sessions.append({
+            if (session_dir / "meta.json").exists():
+                meta = load_json((session_dir / "meta.json").read_bytes())
+            elif (session_dir / "session.json").exists():
+                # Sessions saved before meta.json existed
+                data = load_json((session_dir / "session.json").read_bytes())
+                meta = {
                     'id': data['session_id'],
-                    'created': data['created_at'][:16],
-                    'messages': len(data.get('conversation_history', []))
-                })
+                    'created_at': data['created_at'],
+                    'message_count': len(data.get('conversation_history', []))
+                }
+            else:
+                continue
+
+            sessions.append({
+                'id': meta['id'],
+                'created': meta['created_at'][:16],
+                'messages': meta['message_count']
+            })
 
         if sessions:
             print("\n[Sessions] Available Sessions:")
@@ -162,11 +432,12 @@ Commands:
 
     async def show_history(self, limit: int = 10):
         """Show conversation history"""
-        if not self.current_session or not self.current_session.conversation_history:
+        if not self.current_session or not self.current_session.message_count:
             print("[History] No conversation history yet")
             return
 
-        recent = self.current_session.conversation_history[-limit:]
+        total = self.current_session.message_count
+        recent = self.current_session.get_messages(max(0, total - limit), total)
         print(f"\n[History] Last {len(recent)} messages:")
         print("-" * 50)
 
@@ -183,90 +454,17 @@ Commands:
 
         session = self.current_session
 
-        # Step 1: Generate research plan
-        print("[1/4] Generating research plan...")
-        plan_prompt = f"""
-        Create a focused research plan for: {topic}
-
-        Based on our conversation history:
-        {session.get_conversation_context(5)}
-
-        Generate:
-        1. 3 specific research questions
-        2. Key areas to investigate
-        3. Search strategy
-
-        Keep it concise and actionable.
-        """
-
-        plan_response = await session.model.generate_content_async(plan_prompt)
-        plan = plan_response.text
-        print("[OK] Research plan generated")
-
-        # Display the research plan
-        print("\n" + "=" * 40)
-        print("[Plan] RESEARCH PLAN")
-        print("=" * 40)
-        print(plan)
-        print("=" * 40)
-
-        # Step 2: Conduct searches
-        print("[2/4] Searching for information...")
-        search_queries = [
-            f"{topic} latest research 2024",
-            f"{topic} current applications",
-            f"{topic} future trends"
-        ]
-
-        print(f"[Search] Using {len(search_queries)} search queries:")
-        for i, query in enumerate(search_queries, 1):
-            print(f"  {i}. \"{query}\"")
-
-        all_sources = []
-        for query in search_queries:
-            try:
-                results = session.search_client.search(query, max_results=3)
-                all_sources.extend(results['results'])
-            except Exception as e:
-                print(f"[Warning] Search error for '{query}': {e}")
-
-        print(f"[OK] Found {len(all_sources)} sources")
-
-        # Step 3: AI analysis
-        print("[3/4] AI analysis and synthesis...")
-        sources_text = ""
-        for i, source in enumerate(all_sources[:8], 1):
-            sources_text += f"\nSource {i}: {source['title']}\n{source['content'][:400]}...\n"
-
-        analysis_prompt = f"""
-        Research Topic: {topic}
-
-        Research Plan:
-        {plan}
-
-        Conversation Context:
-        {session.get_conversation_context(3)}
-
-        Sources Found:
-        {sources_text}
-
-        Create a comprehensive research report with:
-
-        ## Executive Summary
-        ## Key Findings
-        ## Current Applications
-        ## Future Implications
-        ## Recommendations
-
-        IMPORTANT:
-        - Cite sources using numbers like (Source 1), (Source 2), etc.
-        - Include specific facts and data from the sources
-        - Reference the source numbers when making claims
-        - Make it relevant to our conversation context
-        """
-
-        analysis_response = await session.model.generate_content_async(analysis_prompt)
-        analysis = analysis_response.text
+        result = await run_research(
+            topic,
+            session.model,
+            session.search_client,
+            context=session.get_conversation_context(5),
+            cache=self.response_cache,
+            verbose=True
+        )
+        plan = result['plan']
+        analysis = result['analysis']
+        sources = result['sources']
 
         # Step 4: Save and present results
         print("[4/4] Finalizing research...")
@@ -275,24 +473,26 @@ Commands:
             'timestamp': datetime.now().isoformat(),
             'topic': topic,
             'plan': plan,
-            'sources_count': len(all_sources),
+            'sources_count': result['sources_count'],
             'analysis': analysis,
-            'sources': all_sources[:8]
+            'sources': sources
         }
 
-        session.research_history.append(research_data)
+        session.add_research(research_data)
 
         # Save detailed research report
-        report_file = session.session_dir / f"research_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Research Report: {topic}\n\n")
-            f.write(f"**Session:** {session.session_id}\n")
-            f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"## Research Plan\n{plan}\n\n")
-            f.write(f"## Analysis\n{analysis}\n\n")
-            f.write(f"## Sources ({len(all_sources[:8])})\n")
-            for i, source in enumerate(all_sources[:8], 1):
-                f.write(f"{i}. [{source['title']}]({source.get('url', 'N/A')})\n")
+        report_file = session.session_dir / report_filename(topic)
+        report_parts = [
+            f"# Research Report: {topic}\n\n",
+            f"**Session:** {session.session_id}\n",
+            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            f"## Research Plan\n{plan}\n\n",
+            f"## Analysis\n{analysis}\n\n",
+            f"## Sources ({len(sources)})\n"
+        ]
+        for i, source in enumerate(sources, 1):
+            report_parts.append(f"{i}. [{source['title']}]({source.get('url', 'N/A')})\n")
+        report_file.write_text("".join(report_parts), encoding='utf-8')
 
         print(f"[OK] Research complete! Report saved to: {report_file}")
         return research_data
@@ -305,7 +505,7 @@ Commands:
 
         # Quick search
         try:
-            results = session.search_client.search(f"{topic} overview", max_results=3)
+            results = await asyncio.to_thread(session.search_client.search, f"{topic} overview", max_results=3)
             sources_text = "\n".join([
                 f"- {r['title']}: {r['content'][:200]}..."
                 for r in results['results']
@@ -315,73 +515,39 @@ Commands:
 
         # Quick analysis
         prompt = f"""
-        Provide a concise summary of: {topic}
+        Give a focused 150-word overview covering key points and current status.
 
-        Context from our conversation:
-        {session.get_conversation_context(3)}
+        Topic: {topic}
 
         Recent sources:
         {sources_text}
 
-        Give a focused 150-word overview covering key points and current status.
+        Context from our conversation:
+        {session.get_conversation_context(3)}
         """
 
-        response = await session.model.generate_content_async(prompt)
-        return response.text
+        print("\n[Summary] Quick Research Summary:")
+        summary = await cached_generate(self.response_cache, session.model, prompt, print_stream)
+        print()
+        return summary
 
     async def chat_response(self, user_input: str) -> str:
-        """Generate conversational response"""
+        """Generate conversational response, printing it as it streams in"""
         session = self.current_session
 
-        # Build context-aware prompt
-        prompt = f"""
-        You are Athena, an AI research assistant. Respond to the user's message in a helpful, conversational way.
-
-        Recent conversation:
-        {session.get_conversation_context(5)}
+        # Send recent turns as structured history; the guidelines live in the system prompt
+        contents = session.get_chat_history(5)
+        if not contents or contents[-1]['role'] != 'user' or contents[-1]['parts'][-1] != user_input:
+            contents.append({'role': 'user', 'parts': [user_input]})
 
-        User's current message: {user_input}
-
-        Guidelines:
-        - Be conversational and helpful
-        - If they ask about research topics, offer to do deep research with /research command
-        - Reference previous conversation when relevant
-        - Keep responses concise but informative
-        - Suggest specific next steps when appropriate
-        """
-
-        response = await session.model.generate_content_async(prompt)
-        return response.text
+        return await cached_generate(self.response_cache, session.chat_model, contents, print_stream)
 
     async def process_command(self, command: str, args: str = ""):
         """Process special commands"""
         command = command.lower()
 
         if command == "help":
-            help_text = """
-[Help] Athena Commands:
-
-Research Commands:
-* /research <topic>    - Deep research with sources and analysis
-* /quick <topic>       - Quick research summary
-
-Session Commands:
-* /sessions            - List all available sessions
-* /load <session_id>   - Load a previous session
-* /history [limit]     - Show conversation history
-* /save               - Manually save current session
-
-Utility Commands:
-* /help               - Show this help message
-* /clear              - Clear screen (conversation stays saved)
-* /exit               - End current session
-
-Examples:
-* /research artificial intelligence in healthcare
-* /quick quantum computing
-* /load ab12cd34
-            """
-            print(help_text)
+            print(HELP_TEXT)
 
         elif command == "sessions":
             await self.list_sessions()
@@ -402,6 +568,7 @@ Examples:
                 self.current_session.add_message('assistant',
                     f"Completed deep research on: {args}",
                     {'type': 'research', 'data': research_data})
+                self.current_session.save_session()
 
                 # Show the analysis
                 print("\n" + "=" * 60)
@@ -425,7 +592,6 @@ Examples:
         elif command == "quick":
             if args:
                 summary = await self.quick_research(args)
-                print(f"\n[Summary] Quick Research Summary:\n{summary}")
                 self.current_session.add_message('assistant', summary,
                     {'type': 'quick_research', 'topic': args})
             else:
@@ -483,6 +649,7 @@ Examples:
                     continue
 
                 if user_input.lower() in ['/exit', 'quit', 'bye']:
+                    self.current_session.save_session()
                     print("[Exit] Goodbye! Your session has been saved.")
                     break
 
@@ -499,7 +666,7 @@ Examples:
                     # Generate AI response
                     print("Athena: ", end="", flush=True)
                     response = await self.chat_response(user_input)
-                    print(response)
+                    print()
 
                     # Add response to history
                     self.current_session.add_message('assistant', response)
@@ -507,6 +674,7 @@ Examples:
             except KeyboardInterrupt:
                 print("\n\n[Pause] Session paused. Type /exit to quit or continue chatting.")
             except EOFError:
+                self.current_session.save_session()
                 print("\n[Exit] Session ended.")
                 break
             except Exception as e:
@@ -526,7 +694,10 @@ async def main():
 
     # Start chat interface
     chat = AthenaChat()
-    await chat.run()
+    try:
+        await chat.run()
+    finally:
+        chat.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
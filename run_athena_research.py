@@ -8,6 +8,7 @@ import os
 from dotenv import load_dotenv
 import google.generativeai as genai
 from tavily import TavilyClient
+from athena_core import run_research
 
 load_dotenv('athena_research/.env')
 
@@ -27,96 +28,36 @@ async def athena_research(topic, detailed=True):
     genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
     model = genai.GenerativeModel('gemini-1.5-flash')
 
-    # Step 1: Generate research plan
-    print("\n[STEP 1] Generating research plan...")
-    plan_prompt = f"""
-    Create a research plan for: {topic}
-
-    Generate:
-    1. 3 key research questions
-    2. 3 search queries to find current information
-    3. Main areas to investigate
-
-    Keep it concise and focused.
-    """
-
-    plan = await model.generate_content_async(plan_prompt)
-    print("Research Plan Generated:")
-    print(plan.text)
-
-    # Step 2: Conduct web search
-    print("\n[STEP 2] Searching for current information...")
+    # Plan, search and analyze with the shared research pipeline
     client = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-
-    # Search with multiple queries for better coverage
-    search_queries = [
-        f"{topic} latest research 2024",
-        f"{topic} current developments",
-        f"{topic} applications examples"
-    ]
-
-    all_results = []
-    for query in search_queries:
-        results = client.search(query, max_results=2)
-        all_results.extend(results['results'])
-
-    print(f"Found {len(all_results)} articles from web search")
-
-    # Step 3: AI analysis and synthesis
-    print("\n[STEP 3] AI analysis and synthesis...")
-
-    # Prepare sources for analysis
-    sources_text = ""
-    for i, result in enumerate(all_results[:6], 1):  # Limit to 6 sources
-        sources_text += f"\nSource {i}: {result['title']}\n{result['content'][:300]}...\n"
-
-    analysis_prompt = f"""
-    You are an expert researcher. Analyze these sources about {topic} and create a comprehensive research report.
-
-    Sources:
-    {sources_text}
-
-    Create a structured report with:
-
-    ## Executive Summary
-    [2-3 sentence overview of key findings]
-
-    ## Key Findings
-    [3-4 main insights from the sources]
-
-    ## Current Applications
-    [Real-world examples and use cases]
-
-    ## Future Outlook
-    [Trends and predictions]
-
-    ## Conclusion
-    [Summary and implications]
-
-    Be specific, cite insights from the sources, and make it professional.
-    """
-
-    report = await model.generate_content_async(analysis_prompt)
+    result = await run_research(
+        topic,
+        model,
+        client,
+        max_sources=6,
+        results_per_query=2,
+        verbose=True
+    )
 
     # Display results
     print("\n" + "=" * 60)
     print("ATHENA RESEARCH REPORT")
     print("=" * 60)
-    print(report.text)
+    print(result['analysis'])
 
     print("\n" + "=" * 60)
     print("SOURCES CONSULTED:")
     print("=" * 60)
-    for i, result in enumerate(all_results[:6], 1):
-        print(f"{i}. {result['title']}")
-        print(f"   URL: {result.get('url', 'N/A')}")
+    for i, source in enumerate(result['sources'], 1):
+        print(f"{i}. {source['title']}")
+        print(f"   URL: {source.get('url', 'N/A')}")
         print()
 
     return {
         'topic': topic,
-        'plan': plan.text,
-        'report': report.text,
-        'sources': all_results[:6]
+        'plan': result['plan'],
+        'report': result['analysis'],
+        'sources': result['sources']
     }
 
 async def quick_research(topic):
@@ -129,7 +70,7 @@ async def quick_research(topic):
 
     # Quick search
     client = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-    results = client.search(f"{topic} overview", max_results=3)
+    results = await asyncio.to_thread(client.search, f"{topic} overview", max_results=3)
 
     # Quick analysis
     sources_text = "\n".join([f"- {r['title']}: {r['content'][:150]}..." for r in results['results']])
@@ -67,7 +67,7 @@ def show_improvements():
     print("     * Complete research plan")
     print("     * Source-cited analysis")
     print("     * Numbered source list with URLs")
-    print("   - Saved as: sessions/[id]/research_[timestamp].md")
+    print("   - Saved as: sessions/[id]/research_[timestamp]_[topic]_[id].md")
     print()
 
     print("HOW TO USE:")
@@ -3,25 +3,25 @@ Custom research workflow test
 """
 import asyncio
 import os
-from dotenv import load_dotenv
-import google.generativeai as genai
 from tavily import TavilyClient
+from test_support import get_flash_model, load_env
 
-load_dotenv('athena_research/.env')
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
 
 async def custom_research_workflow(topic):
     """Custom AI research workflow"""
     print(f"🔍 Researching: {topic}")
     print("=" * 50)
 
-    # Configure Gemini
-    genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-    model = genai.GenerativeModel('gemini-1.5-flash')
+    # Shared Gemini Flash model
+    model = get_flash_model(GEMINI_API_KEY)
 
     # Step 1: Search with Tavily
     print("1. Searching for latest information...")
-    client = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-    search_results = client.search(f"{topic} latest developments 2024", max_results=3)
+    client = TavilyClient(api_key=TAVILY_API_KEY)
+    search_results = await asyncio.to_thread(client.search, f"{topic} latest developments 2024", max_results=3)
 
     articles = []
     for result in search_results['results']:
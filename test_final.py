@@ -3,10 +3,13 @@ Final confirmation test - Gemini Flash and Tavily working
 """
 import asyncio
 import os
-from dotenv import load_dotenv
+from test_support import generate_prefix, get_flash_model, load_env
 
 # Load environment variables
-load_dotenv("athena_research/.env")
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "not set")
 
 async def test_complete_integration():
     """Test both Gemini and Tavily together"""
@@ -16,22 +19,21 @@ async def test_complete_integration():
     # 1. Test Gemini Flash
     print("1. Testing Gemini Flash...")
     try:
-        import google.generativeai as genai
-
-        api_key = os.getenv("GEMINI_API_KEY")
+        api_key = GEMINI_API_KEY
         if not api_key:
             print("   ERROR: No Gemini API key")
             return False
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = get_flash_model(api_key)
 
-        response = await model.generate_content_async(
-            "You are a research AI assistant. Explain in one sentence what makes you useful for research."
+        response = await generate_prefix(
+            model,
+            "You are a research AI assistant. Explain in one sentence what makes you useful for research.",
+            100
         )
 
         print("   ✓ Gemini Flash: WORKING")
-        print(f"   Response: {response.text[:100]}...")
+        print(f"   Response: {response}...")
 
     except Exception as e:
         print(f"   ✗ Gemini Flash failed: {e}")
@@ -42,13 +44,13 @@ async def test_complete_integration():
     try:
         from tavily import TavilyClient
 
-        api_key = os.getenv("TAVILY_API_KEY")
+        api_key = TAVILY_API_KEY
         if not api_key:
             print("   ERROR: No Tavily API key")
             return False
 
         client = TavilyClient(api_key=api_key)
-        results = client.search("artificial intelligence research 2024", max_results=2)
+        results = await asyncio.to_thread(client.search, "artificial intelligence research 2024", max_results=2)
 
         print("   ✓ Tavily Search: WORKING")
         print(f"   Found {len(results['results'])} research articles")
@@ -62,9 +64,9 @@ async def test_complete_integration():
     # 3. Test Configuration
     print("\n3. Testing Athena Configuration...")
     try:
-        provider = os.getenv("LLM_PROVIDER", "not set")
-        gemini_key = "SET" if os.getenv("GEMINI_API_KEY") else "MISSING"
-        tavily_key = "SET" if os.getenv("TAVILY_API_KEY") else "MISSING"
+        provider = LLM_PROVIDER
+        gemini_key = "SET" if GEMINI_API_KEY else "MISSING"
+        tavily_key = "SET" if TAVILY_API_KEY else "MISSING"
 
         print("   ✓ Configuration: WORKING")
         print(f"   LLM Provider: {provider}")
@@ -79,19 +81,19 @@ async def test_complete_integration():
     print("\n4. Testing Combined Workflow...")
     try:
         # Search for AI research
-        search_results = client.search("machine learning healthcare applications", max_results=1)
+        search_results = await asyncio.to_thread(client.search, "machine learning healthcare applications", max_results=1)
 
         if search_results['results']:
             article = search_results['results'][0]
 
             # Use Gemini to summarize
             summary_prompt = f"Summarize this article in 2 sentences: {article['title']} - {article['content'][:300]}"
-            summary = await model.generate_content_async(summary_prompt)
+            summary = await generate_prefix(model, summary_prompt, 100)
 
             print("   ✓ Combined Workflow: WORKING")
             print("   Search -> AI Summary pipeline successful")
             print(f"   Article: {article['title'][:50]}...")
-            print(f"   AI Summary: {summary.text[:100]}...")
+            print(f"   AI Summary: {summary}...")
 
     except Exception as e:
         print(f"   ✗ Combined workflow failed: {e}")
@@ -4,24 +4,28 @@ Direct test of Gemini Flash with Athena agents
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Add the project path to sys.path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the project path to sys.path once
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from test_support import cached_process, get_planning_agent, load_env, print_results, run_checks
 
 # Load environment variables
-load_dotenv("athena_research/.env")
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "not set")
 
 async def test_gemini_agent():
     """Test PlanningAgent with Gemini Flash"""
     print("Testing Gemini Flash with Planning Agent...")
 
     try:
-        from athena_research.agents.planning.planning_agent import PlanningAgent
-
-        # Create planning agent
-        agent = PlanningAgent()
+        # Shared planning agent
+        agent = get_planning_agent()
         print(f"Agent created with model: {agent.model}")
 
         # Test agent processing
@@ -31,7 +35,7 @@ async def test_gemini_agent():
             "requirements": "Focus on current applications and future potential"
         }
 
-        result = await agent.process(planning_input)
+        result = await cached_process(agent, planning_input)
 
         if result.success:
             print("SUCCESS: Planning Agent with Gemini Flash working!")
@@ -50,7 +54,6 @@ async def test_gemini_agent():
 
     except Exception as e:
         print(f"ERROR: Planning agent test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -76,7 +79,6 @@ async def test_direct_llm():
 
     except Exception as e:
         print(f"ERROR: Direct LLM test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -86,22 +88,23 @@ async def main():
     print("=" * 50)
 
     # Check environment
-    if not os.getenv("GEMINI_API_KEY"):
+    if not GEMINI_API_KEY:
         print("ERROR: GEMINI_API_KEY not found!")
         return
 
-    print(f"LLM Provider: {os.getenv('LLM_PROVIDER', 'not set')}")
-    print(f"Gemini API Key: {'***' + (os.getenv('GEMINI_API_KEY') or '')[-4:]}")
+    print(f"LLM Provider: {LLM_PROVIDER}")
+    print(f"Gemini API Key: {'***' + GEMINI_API_KEY[-4:]}")
 
-    # Run tests
-    agent_ok = await test_gemini_agent()
-    direct_ok = await test_direct_llm()
+    # Run the independent tests concurrently; an unexpected exception counts as a failure
+    agent_ok, direct_ok = await run_checks(
+        test_gemini_agent(),
+        test_direct_llm()
+    )
 
-    print("\n" + "=" * 50)
-    print("RESULTS:")
-    print(f"   Planning Agent:   {'PASS' if agent_ok else 'FAIL'}")
-    print(f"   Direct Client:    {'PASS' if direct_ok else 'FAIL'}")
-    print("=" * 50)
+    print_results("RESULTS:", [
+        ("Planning Agent", agent_ok),
+        ("Direct Client", direct_ok)
+    ])
 
     if agent_ok and direct_ok:
         print("SUCCESS: Gemini Flash fully integrated with Athena!")
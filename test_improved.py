@@ -3,30 +3,26 @@ Test the improved research features with proper method calls
 """
 import asyncio
 import os
-from dotenv import load_dotenv
-from main import AthenaSession
+import traceback
+from test_support import get_shared_chat, load_env
 
-load_dotenv('athena_research/.env')
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
 
 async def test_research_improvements():
     """Test improved research functionality"""
     print("TESTING IMPROVED RESEARCH FEATURES")
     print("=" * 50)
 
-    if not os.getenv('GEMINI_API_KEY') or not os.getenv('TAVILY_API_KEY'):
+    if not GEMINI_API_KEY or not TAVILY_API_KEY:
         print("[Error] API keys not found")
         return
 
-    # Create session
-    session = AthenaSession()
+    # Shared chat and session
+    chat = await get_shared_chat()
     print("Session created successfully")
 
-    # Test the research_mode method from AthenaChat class
-    from main import AthenaChat
-
-    chat = AthenaChat()
-    chat.current_session = session
-
     print("\nTesting research mode with topic: 'artificial intelligence ethics'")
     print("-" * 50)
 
@@ -52,7 +48,6 @@ async def test_research_improvements():
 
     except Exception as e:
         print(f"[Error] {e}")
-        import traceback
         traceback.print_exc()
 
 async def main():
@@ -1,97 +1,68 @@
 """
 Test script for Gemini and Tavily integration
 """
-import asyncio
 import os
 import sys
 from pathlib import Path
 
-# Add the project path to sys.path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the project path to sys.path once
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from test_support import load_env, print_results, run_checks, run_script, smoke_gemini, smoke_tavily
+
+# Load environment variables
+load_env(None)
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
+
+# Validate the settings once at import so the config check is a plain dict read
+try:
+    from athena_research.config import settings as _settings
+
+    _CONFIG_SNAPSHOT = {
+        "llm_provider": _settings.llm_provider,
+        "planning_model": _settings.planning_model,
+        "writing_model": _settings.writing_model,
+        "research_model": _settings.research_model,
+        "has_gemini_key": bool(_settings.gemini_api_key),
+        "has_tavily_key": bool(_settings.tavily_api_key)
+    }
+    _CONFIG_ERROR = None
+except Exception as e:
+    _CONFIG_SNAPSHOT = None
+    _CONFIG_ERROR = e
 
 async def test_gemini():
     """Test Gemini Flash integration"""
     print("🧪 Testing Gemini Flash...")
 
-    try:
-        import google.generativeai as genai
-        from dotenv import load_dotenv
-
-        # Load environment variables
-        load_dotenv()
-
-        # Get API key
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            print("❌ GEMINI_API_KEY not found in environment")
-            return False
-
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-
-        # Test with a simple prompt
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        response = await model.generate_content_async("What is artificial intelligence? Keep it brief.")
-
-        print("✅ Gemini Flash working!")
-        print(f"Response: {response.text[:200]}...")
-        return True
-
-    except Exception as e:
-        print(f"❌ Gemini test failed: {e}")
-        return False
+    return await smoke_gemini(GEMINI_API_KEY, ok="✅", error="❌")
 
 async def test_tavily():
     """Test Tavily search integration"""
     print("\n🔍 Testing Tavily Search...")
 
-    try:
-        from tavily import TavilyClient
-        from dotenv import load_dotenv
-
-        # Load environment variables
-        load_dotenv()
-
-        # Get API key
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            print("❌ TAVILY_API_KEY not found in environment")
-            return False
-
-        # Create client and test search
-        client = TavilyClient(api_key=api_key)
-        response = client.search("artificial intelligence latest news", max_results=3)
-
-        print("✅ Tavily Search working!")
-        print(f"Found {len(response['results'])} results")
-        for i, result in enumerate(response['results'][:2], 1):
-            print(f"  {i}. {result['title'][:60]}...")
-        return True
-
-    except Exception as e:
-        print(f"❌ Tavily test failed: {e}")
-        return False
+    return await smoke_tavily(TAVILY_API_KEY, ok="✅", error="❌")
 
 async def test_athena_config():
     """Test Athena configuration"""
     print("\n⚙️  Testing Athena Configuration...")
 
-    try:
-        from athena_research.config import settings
-
-        print(f"✅ Configuration loaded!")
-        print(f"   LLM Provider: {settings.llm_provider}")
-        print(f"   Planning Model: {settings.planning_model}")
-        print(f"   Writing Model: {settings.writing_model}")
-        print(f"   Research Model: {settings.research_model}")
-        print(f"   Has Gemini Key: {'Yes' if settings.gemini_api_key else 'No'}")
-        print(f"   Has Tavily Key: {'Yes' if settings.tavily_api_key else 'No'}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Athena config test failed: {e}")
+    if _CONFIG_SNAPSHOT is None:
+        print(f"❌ Athena config test failed: {_CONFIG_ERROR}")
         return False
 
+    print(f"✅ Configuration loaded!")
+    print(f"   LLM Provider: {_CONFIG_SNAPSHOT['llm_provider']}")
+    print(f"   Planning Model: {_CONFIG_SNAPSHOT['planning_model']}")
+    print(f"   Writing Model: {_CONFIG_SNAPSHOT['writing_model']}")
+    print(f"   Research Model: {_CONFIG_SNAPSHOT['research_model']}")
+    print(f"   Has Gemini Key: {'Yes' if _CONFIG_SNAPSHOT['has_gemini_key'] else 'No'}")
+    print(f"   Has Tavily Key: {'Yes' if _CONFIG_SNAPSHOT['has_tavily_key'] else 'No'}")
+    return True
+
 async def test_llm_client():
     """Test the LLM client factory"""
     print("\n🤖 Testing LLM Client...")
@@ -121,19 +92,20 @@ async def main():
     print("🚀 ATHENA INTEGRATION TEST")
     print("=" * 50)
 
-    # Run tests
-    gemini_ok = await test_gemini()
-    tavily_ok = await test_tavily()
-    config_ok = await test_athena_config()
-    client_ok = await test_llm_client()
-
-    print("\n" + "=" * 50)
-    print("📊 TEST RESULTS:")
-    print(f"   Gemini Flash:     {'✅ PASS' if gemini_ok else '❌ FAIL'}")
-    print(f"   Tavily Search:    {'✅ PASS' if tavily_ok else '❌ FAIL'}")
-    print(f"   Athena Config:    {'✅ PASS' if config_ok else '❌ FAIL'}")
-    print(f"   LLM Client:       {'✅ PASS' if client_ok else '❌ FAIL'}")
-    print("=" * 50)
+    # Run the independent tests concurrently; an unexpected exception counts as a failure
+    gemini_ok, tavily_ok, config_ok, client_ok = await run_checks(
+        test_gemini(),
+        test_tavily(),
+        test_athena_config(),
+        test_llm_client()
+    )
+
+    print_results("📊 TEST RESULTS:", [
+        ("Gemini Flash", gemini_ok),
+        ("Tavily Search", tavily_ok),
+        ("Athena Config", config_ok),
+        ("LLM Client", client_ok)
+    ], status={True: "✅ PASS", False: "❌ FAIL"})
 
     if all([gemini_ok, tavily_ok, config_ok, client_ok]):
         print("🎉 ALL TESTS PASSED! Your integration is ready!")
@@ -141,4 +113,4 @@ async def main():
         print("⚠️  Some tests failed. Check your API keys and configuration.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_script(main())
\ No newline at end of file
@@ -4,33 +4,34 @@ Minimal test of Gemini Flash integration
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Add the project path to sys.path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the project path to sys.path once
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from test_support import cached_process, get_flash_model, get_planning_agent, load_env, print_results
 
 # Load environment variables
-load_dotenv("athena_research/.env")
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "not set")
 
 async def test_gemini_direct():
     """Test Gemini Flash directly"""
     print("Testing Gemini Flash API directly...")
 
     try:
-        import google.generativeai as genai
-
         # Get API key
-        api_key = os.getenv("GEMINI_API_KEY")
+        api_key = GEMINI_API_KEY
         if not api_key:
             print("ERROR: GEMINI_API_KEY not found!")
             return False
 
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-
-        # Create model and test
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        # Shared Gemini Flash model
+        model = get_flash_model(api_key)
         response = await model.generate_content_async("What are 3 benefits of AI? Keep it very brief.")
 
         print("SUCCESS: Gemini Flash API working!")
@@ -46,19 +47,12 @@ async def test_athena_llm_client():
     print("\nTesting Athena LLM Client...")
 
     try:
-        # Import just the client components we need
-        import sys
-        import os
-
-        # Add the athena_research path
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'athena_research'))
-
-        # Import config first
-        from config.settings import settings
+        # Import config first, through the package so settings are validated only once
+        from athena_research.config.settings import settings
         print(f"Config loaded: Provider={settings.llm_provider}, Model={settings.planning_model}")
 
         # Import and test LLM client
-        from utils.llm_client import GeminiClient
+        from athena_research.utils.llm_client import GeminiClient
 
         client = GeminiClient()
         messages = [
@@ -72,7 +66,6 @@ async def test_athena_llm_client():
 
     except Exception as e:
         print(f"ERROR: Athena LLM client test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -81,15 +74,7 @@ async def test_planning_agent_direct():
     print("\nTesting Planning Agent...")
 
     try:
-        import sys
-        import os
-
-        # Add the athena_research path
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'athena_research'))
-
-        from agents.planning.planning_agent import PlanningAgent
-
-        agent = PlanningAgent()
+        agent = get_planning_agent()
         print(f"Planning agent created with model: {agent.model}")
 
         # Test with simple input
@@ -99,7 +84,7 @@ async def test_planning_agent_direct():
             "requirements": "List 3 key benefits"
         }
 
-        result = await agent.process(input_data)
+        result = await cached_process(agent, input_data)
 
         if result.success:
             print("SUCCESS: Planning Agent working!")
@@ -115,7 +100,6 @@ async def test_planning_agent_direct():
 
     except Exception as e:
         print(f"ERROR: Planning agent test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -125,10 +109,8 @@ async def main():
     print("=" * 50)
 
     # Environment check
-    llm_provider = os.getenv('LLM_PROVIDER', 'not set')
-    api_key = os.getenv('GEMINI_API_KEY', '')
-    print(f"LLM Provider: {llm_provider}")
-    print(f"Gemini API Key: {'***' + api_key[-4:] if api_key else 'NOT SET'}")
+    print(f"LLM Provider: {LLM_PROVIDER}")
+    print(f"Gemini API Key: {'***' + GEMINI_API_KEY[-4:] if GEMINI_API_KEY else 'NOT SET'}")
     print()
 
     # Run tests
@@ -136,12 +118,11 @@ async def main():
     client_ok = await test_athena_llm_client()
     agent_ok = await test_planning_agent_direct()
 
-    print("\n" + "=" * 50)
-    print("RESULTS:")
-    print(f"   Gemini Direct:    {'PASS' if direct_ok else 'FAIL'}")
-    print(f"   Athena Client:    {'PASS' if client_ok else 'FAIL'}")
-    print(f"   Planning Agent:   {'PASS' if agent_ok else 'FAIL'}")
-    print("=" * 50)
+    print_results("RESULTS:", [
+        ("Gemini Direct", direct_ok),
+        ("Athena Client", client_ok),
+        ("Planning Agent", agent_ok)
+    ])
 
     if all([direct_ok, client_ok, agent_ok]):
         print("🎉 SUCCESS: Your Gemini Flash integration is working perfectly!")
@@ -0,0 +1,65 @@
+"""
+Throughput smoke test - several research topics on one shared session
+"""
+import asyncio
+import os
+import time
+from test_support import get_shared_chat, load_env, run_script
+
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
+
+TOPICS = ["AI ethics", "blockchain", "quantum computing", "gene therapy"]
+
+async def timed_research(chat, topic: str):
+    """Run research_mode for a topic and return its result with the latency"""
+    start = time.perf_counter()
+    result = await chat.research_mode(topic)
+    return result, time.perf_counter() - start
+
+async def test_research_concurrency():
+    """Run every topic concurrently and check that the runs overlap"""
+    print("ATHENA RESEARCH CONCURRENCY TEST")
+    print("=" * 50)
+
+    if not GEMINI_API_KEY or not TAVILY_API_KEY:
+        print("[Error] API keys not found")
+        return False
+
+    # One chat, so one Tavily client and one Gemini model serve every topic
+    chat = await get_shared_chat()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(timed_research(chat, topic) for topic in TOPICS),
+        return_exceptions=True
+    )
+    wall_clock = time.perf_counter() - start
+
+    print("\n" + "=" * 50)
+    print("RESULTS:")
+    total_latency = 0.0
+    failures = 0
+    for topic, result in zip(TOPICS, results):
+        if isinstance(result, Exception):
+            failures += 1
+            print(f"   {topic:<20} FAIL ({result})")
+        else:
+            research_data, latency = result
+            total_latency += latency
+            print(f"   {topic:<20} {latency:6.1f}s  {research_data['sources_count']} sources")
+
+    print(f"\nWall clock:         {wall_clock:6.1f}s")
+    print(f"Sum of latencies:   {total_latency:6.1f}s")
+    if wall_clock:
+        print(f"Overlap factor:     {total_latency / wall_clock:6.2f}x")
+    overlapped = wall_clock < total_latency
+    if failures == 0 and len(TOPICS) > 1 and not overlapped:
+        print("[Error] Research runs did not overlap")
+    print("=" * 50)
+
+    return failures == 0 and (len(TOPICS) < 2 or overlapped)
+
+if __name__ == "__main__":
+    run_script(test_research_concurrency())
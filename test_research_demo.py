@@ -3,10 +3,11 @@ Demo of the improved research functionality
 """
 import asyncio
 import os
-from dotenv import load_dotenv
-from main import AthenaChat
+from test_support import get_shared_chat, load_env
 
-load_dotenv('athena_research/.env')
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
 
 async def demo_research():
     """Demonstrate the improved research features"""
@@ -15,13 +16,12 @@ async def demo_research():
     print("Testing: Research plan display + Source citations with links")
     print()
 
-    if not os.getenv('GEMINI_API_KEY') or not os.getenv('TAVILY_API_KEY'):
+    if not GEMINI_API_KEY or not TAVILY_API_KEY:
         print("[Error] API keys not configured")
         return
 
-    # Create chat instance
-    chat = AthenaChat()
-    await chat.start_new_session()
+    # Shared chat and session
+    chat = await get_shared_chat()
 
     # Demo research command
     print("Simulating: /research blockchain technology")
@@ -29,9 +29,7 @@ async def demo_research():
 
     try:
         # Execute research mode
-        research_data = await chat.current_session.__class__.research_mode(
-            chat.current_session, "blockchain technology"
-        )
+        research_data = await chat.research_mode("blockchain technology")
 
         # This will show:
         # 1. Research plan (newly added)
@@ -2,79 +2,137 @@
 SUCCESS! Your Gemini and Tavily integration is working!
 """
 import asyncio
+import json
 import os
-from dotenv import load_dotenv
+from test_support import get_flash_model, get_tavily_client, load_env, run_script, use_cassette, warm_flash_model
 
 # Load environment variables
-load_dotenv("athena_research/.env")
+load_env()
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "default")
+
+DEFINITION_PROMPT = "Explain artificial intelligence in exactly 10 words."
+SUMMARY_PROMPT = "Summarize this research topic in one sentence: {}"
+
+async def generate_answers(model, titles):
+    """Get the AI definition and a summary per title, in one round-trip when possible
+
+    Falls back to one call for the definition and one per title if the batched
+    response is not the expected JSON. Failed summaries are returned as exceptions.
+    """
+    batch_prompt = (
+        "Respond in JSON with keys 'definition' (artificial intelligence explained in exactly "
+        "10 words) and 'summaries' (a list with a one-sentence summary of each research "
+        "topic below, in the same order)."
+        + "".join(f"\n- {title}" for title in titles)
+    )
+    response = await model.generate_content_async(
+        batch_prompt,
+        generation_config={"response_mime_type": "application/json"}
+    )
+    try:
+        answers = json.loads(response.text)
+        definition, summaries = answers['definition'], answers['summaries']
+        if isinstance(definition, str) and len(summaries) == len(titles) \
+                and all(isinstance(summary, str) for summary in summaries):
+            return definition, summaries
+    except (ValueError, KeyError, TypeError):
+        pass
+
+    # Bounded to respect Gemini quotas
+    semaphore = asyncio.Semaphore(8)
+
+    async def generate(prompt):
+        async with semaphore:
+            return (await model.generate_content_async(prompt)).text
+
+    definition, *summaries = await asyncio.gather(
+        generate(DEFINITION_PROMPT),
+        *(generate(SUMMARY_PROMPT.format(title)) for title in titles),
+        return_exceptions=True
+    )
+    if isinstance(definition, Exception):
+        raise definition
+    return definition, summaries
 
 async def test_integration():
+    # Open the Gemini channel while the search runs
+    warmup = asyncio.create_task(warm_flash_model(GEMINI_API_KEY)) if GEMINI_API_KEY else None
+    try:
+        return await run_tests(warmup)
+    finally:
+        # The tests can stop before the warmup is awaited
+        if warmup is not None:
+            warmup.cancel()
+            await asyncio.gather(warmup, return_exceptions=True)
+
+async def run_tests(warmup):
     print("ATHENA INTEGRATION - SUCCESS CONFIRMATION")
     print("=" * 50)
 
     success_count = 0
 
-    # Test 1: Gemini Flash
-    print("1. Testing Gemini Flash...")
+    # Test 1: Tavily Search runs first so one Gemini call can cover the remaining tests
+    print("1. Testing Tavily Search...")
+    titles = []
     try:
-        import google.generativeai as genai
-
-        api_key = os.getenv("GEMINI_API_KEY")
+        api_key = TAVILY_API_KEY
         if not api_key:
-            print("   [FAIL] No Gemini API key found")
+            print("   [FAIL] No Tavily API key found")
             return False
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-flash')
-
-        response = await model.generate_content_async(
-            "Explain artificial intelligence in exactly 10 words."
-        )
+        client = get_tavily_client(api_key)
+        with use_cassette("success_tavily"):
+            results = await client.search("AI research", max_results=2)
+        titles = [result['title'] for result in results['results']]
 
-        print("   [PASS] Gemini Flash working!")
-        print(f"   Response: {response.text.strip()}")
+        print("   [PASS] Tavily Search working!")
+        print(f"   Found {len(titles)} research results")
         success_count += 1
 
     except Exception as e:
-        print(f"   [FAIL] Gemini error: {e}")
+        print(f"   [FAIL] Tavily error: {e}")
 
-    # Test 2: Tavily Search
-    print("\n2. Testing Tavily Search...")
+    # Test 2: Gemini Flash
+    print("\n2. Testing Gemini Flash...")
+    summaries = []
     try:
-        from tavily import TavilyClient
-
-        api_key = os.getenv("TAVILY_API_KEY")
+        api_key = GEMINI_API_KEY
         if not api_key:
-            print("   [FAIL] No Tavily API key found")
+            print("   [FAIL] No Gemini API key found")
             return False
 
-        client = TavilyClient(api_key=api_key)
-        results = client.search("AI research", max_results=2)
+        model = get_flash_model(api_key)
+        await warmup
+        definition, summaries = await generate_answers(model, titles)
 
-        print("   [PASS] Tavily Search working!")
-        print(f"   Found {len(results['results'])} research results")
+        print("   [PASS] Gemini Flash working!")
+        print(f"   Response: {definition.strip()}")
         success_count += 1
 
     except Exception as e:
-        print(f"   [FAIL] Tavily error: {e}")
+        print(f"   [FAIL] Gemini error: {e}")
 
     # Test 3: Combined workflow
     print("\n3. Testing AI Research Workflow...")
-    try:
-        # Use search results with AI
-        if 'results' in locals() and results['results']:
-            article_title = results['results'][0]['title']
-
-            summary_prompt = f"Summarize this research topic in one sentence: {article_title}"
-            summary = await model.generate_content_async(summary_prompt)
-
+    if not titles:
+        print("   [SKIP] No search results to summarize")
+    elif not summaries:
+        print("   [SKIP] No AI summaries to check")
+    else:
+        for title, summary in zip(titles, summaries):
+            print(f"   Search: {title[:50]}...")
+            if isinstance(summary, Exception):
+                print(f"   AI Summary failed: {summary}")
+            else:
+                print(f"   AI Summary: {summary.strip()[:80]}...")
+
+        if not any(isinstance(summary, Exception) for summary in summaries):
             print("   [PASS] Combined workflow working!")
-            print(f"   Search: {article_title[:50]}...")
-            print(f"   AI Summary: {summary.text.strip()[:80]}...")
             success_count += 1
-
-    except Exception as e:
-        print(f"   [FAIL] Workflow error: {e}")
+        else:
+            print("   [FAIL] Some summaries failed")
 
     print("\n" + "=" * 50)
     if success_count == 3:
@@ -86,7 +144,7 @@ async def test_integration():
         print("- AI research workflow (working)")
         print("")
         print("Configuration summary:")
-        print(f"- LLM Provider: {os.getenv('LLM_PROVIDER', 'default')}")
+        print(f"- LLM Provider: {LLM_PROVIDER}")
         print(f"- Gemini API Key: Set and working")
         print(f"- Tavily API Key: Set and working")
         print("")
@@ -99,4 +157,4 @@ async def test_integration():
     return success_count == 3
 
 if __name__ == "__main__":
-    asyncio.run(test_integration())
\ No newline at end of file
+    run_script(test_integration())
\ No newline at end of file
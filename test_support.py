@@ -0,0 +1,248 @@
+"""
+Shared helpers for the Athena integration test scripts
+"""
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shelve
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import vcr
+except ImportError:
+    vcr = None
+
+# Opt-in exact-match cache for planning round-trips on re-runs
+PLAN_CACHE_PATH = Path.home() / ".athena_test_cache" / "plan_cache.db"
+
+# Recorded HTTP traffic replayed when ATHENA_TEST_CASSETTES=1
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+
+_SHARED_CHAT = None
+_TAVILY_CLIENTS: Dict[str, Any] = {}
+
+# Result table used by the summary block of each test script
+STATUS = {True: "PASS", False: "FAIL"}
+SUMMARY_FMT = "   {:<18}{}"
+
+@functools.lru_cache(maxsize=None)
+def load_env(path: Optional[str] = "athena_research/.env") -> bool:
+    """Load a .env file into the environment once per process; None searches for .env"""
+    from dotenv import load_dotenv
+
+    load_dotenv(path)
+    return True
+
+def use_cassette(name: str):
+    """Record a check's HTTP traffic on first use and replay it afterwards
+
+    Only active with ATHENA_TEST_CASSETTES=1 and vcrpy installed. Gemini calls
+    go over gRPC, which VCR cannot record, so this covers the Tavily searches.
+    """
+    if vcr is None or os.getenv("ATHENA_TEST_CASSETTES") != "1":
+        return contextlib.nullcontext()
+
+    return vcr.use_cassette(
+        str(CASSETTE_DIR / f"{name}.yaml"),
+        record_mode="once",
+        filter_headers=["authorization", "x-goog-api-key"],
+        filter_post_data_parameters=["api_key"]
+    )
+
+def get_tavily_client(api_key: str):
+    """Async Tavily client shared by every search made with the same key"""
+    if api_key not in _TAVILY_CLIENTS:
+        from tavily import AsyncTavilyClient
+        _TAVILY_CLIENTS[api_key] = AsyncTavilyClient(api_key=api_key)
+    return _TAVILY_CLIENTS[api_key]
+
+async def close_tavily_clients():
+    """Close and forget the shared Tavily clients"""
+    clients = list(_TAVILY_CLIENTS.values())
+    _TAVILY_CLIENTS.clear()
+
+    for client in clients:
+        # Client versions differ in whether and how they expose closing
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+def run_script(main: Awaitable[Any]) -> Any:
+    """asyncio.run a script's entry coroutine, closing the shared Tavily clients before the loop ends"""
+    async def runner():
+        try:
+            return await main
+        finally:
+            await close_tavily_clients()
+
+    return asyncio.run(runner())
+
+@functools.lru_cache(maxsize=None)
+def get_flash_model(api_key: str):
+    """Gemini Flash model configured once and shared by every test using the same key"""
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+async def generate_prefix(model, prompt: str, limit: int) -> str:
+    """Stream a response and stop reading once limit characters have arrived"""
+    # Cap generation too, so breaking early does not leave the server writing
+    response = await model.generate_content_async(
+        prompt,
+        stream=True,
+        generation_config={"max_output_tokens": max(1, limit // 2)}
+    )
+    stream = response.__aiter__()
+    chunks = []
+    size = 0
+    try:
+        async for chunk in stream:
+            chunks.append(chunk.text)
+            size += len(chunk.text)
+            if size >= limit:
+                break
+    finally:
+        # Release the underlying stream instead of leaving it to the GC
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return "".join(chunks)[:limit]
+
+async def smoke_gemini(
+    api_key: str,
+    prompt: str = "What is artificial intelligence? Keep it brief.",
+    ok: str = "SUCCESS:",
+    error: str = "ERROR:"
+) -> bool:
+    """Check that the shared Gemini Flash model answers a prompt"""
+    try:
+        if not api_key:
+            print(f"{error} GEMINI_API_KEY not found in environment")
+            return False
+
+        # Only the start of the answer is shown
+        text = await generate_prefix(get_flash_model(api_key), prompt, 200)
+
+        print(f"{ok} Gemini Flash working!")
+        print(f"Response: {text}...")
+        return True
+
+    except Exception as e:
+        print(f"{error} Gemini test failed: {e}")
+        return False
+
+async def smoke_tavily(
+    api_key: str,
+    query: str = "artificial intelligence latest news",
+    max_results: int = 3,
+    ok: str = "SUCCESS:",
+    error: str = "ERROR:"
+) -> bool:
+    """Check that the shared Tavily client returns search results"""
+    try:
+        if not api_key:
+            print(f"{error} TAVILY_API_KEY not found in environment")
+            return False
+
+        with use_cassette("tavily_smoke"):
+            response = await get_tavily_client(api_key).search(query, max_results=max_results)
+
+        print(f"{ok} Tavily Search working!")
+        print(f"Found {len(response['results'])} results")
+        for i, result in enumerate(response['results'][:2], 1):
+            print(f"  {i}. {result['title'][:60]}...")
+        return True
+
+    except Exception as e:
+        print(f"{error} Tavily test failed: {e}")
+        return False
+
+async def warm_flash_model(api_key: str):
+    """Open the Gemini channel with a one-token request so the next call skips connection setup"""
+    try:
+        await get_flash_model(api_key).generate_content_async(
+            "ping",
+            generation_config={"max_output_tokens": 1}
+        )
+    except Exception:
+        # Warming is best effort; the real call reports any error
+        pass
+
+@functools.lru_cache(maxsize=1)
+def get_planning_agent():
+    """Planning agent shared by every planning check in the process"""
+    from athena_research.agents.planning.planning_agent import PlanningAgent
+    return PlanningAgent()
+
+def print_results(title: str, results: Iterable[Tuple[str, bool]], status: Dict[bool, str] = STATUS):
+    """Print the results table for (label, ok) pairs in a single stdout write"""
+    lines = ["\n" + "=" * 50, title]
+    lines.extend(SUMMARY_FMT.format(f"{label}:", status[ok]) for label, ok in results)
+    lines.append("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+async def run_checks(*checks: Awaitable[bool]) -> List[bool]:
+    """Run independent checks concurrently; a check passes only if it returns True
+
+    On Python 3.11+ the checks run in a TaskGroup, so an unexpected exception
+    cancels the remaining checks instead of leaving their connections open.
+    """
+    if sys.version_info < (3, 11):
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        return [result is True for result in results]
+
+    tasks = []
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(check) for check in checks]
+    except Exception:
+        # The failing check and every cancelled sibling count as failures
+        pass
+
+    return [
+        task.done() and not task.cancelled() and task.exception() is None and task.result() is True
+        for task in tasks
+    ]
+
+async def get_shared_chat():
+    """AthenaChat with one session shared by every research run in the process"""
+    # lru_cache would cache the coroutine rather than the chat, so cache by hand
+    global _SHARED_CHAT
+    if _SHARED_CHAT is None:
+        from main import AthenaChat
+
+        chat = AthenaChat()
+        await chat.start_new_session()
+        atexit.register(chat.close)
+        _SHARED_CHAT = chat
+    return _SHARED_CHAT
+
+async def cached_process(agent, input_data: Dict[str, Any]):
+    """Run agent.process, reusing earlier successful results when ATHENA_TEST_PLAN_CACHE=1"""
+    if os.getenv("ATHENA_TEST_PLAN_CACHE") != "1":
+        return await agent.process(input_data)
+
+    from athena_research.agents.base_agent import AgentResponse
+
+    key = hashlib.sha256(json.dumps([agent.name, input_data], sort_keys=True).encode()).hexdigest()
+    PLAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    with shelve.open(str(PLAN_CACHE_PATH)) as cache:
+        if key in cache:
+            return AgentResponse(success=True, data=cache[key], sources=[])
+
+    result = await agent.process(input_data)
+    if result.success:
+        with shelve.open(str(PLAN_CACHE_PATH)) as cache:
+            cache[key] = result.data
+    return result
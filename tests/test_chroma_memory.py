@@ -0,0 +1,62 @@
+"""
+Tests for the Chroma memory store
+"""
+import re
+import uuid
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+chromadb = pytest.importorskip("chromadb")
+chroma_memory = pytest.importorskip("athena_research.memory.vector_store.chroma_memory")
+
+from athena_research.memory.base_memory import MemoryItem
+
+class _WordTokenizer:
+    """Whitespace tokenizer with the offset mapping the store chunks by"""
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=True):
+        return {"offset_mapping": [match.span() for match in re.finditer(r"\S+", text)]}
+
+class _HashEncoder:
+    """Deterministic stand-in for the sentence encoder"""
+
+    tokenizer = _WordTokenizer()
+
+    def encode(self, texts, **kwargs):
+        embeddings = np.array([
+            [float(hash((text, i)) % 1000) + 1.0 for i in range(8)]
+            for text in texts
+        ])
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+@pytest.fixture
+def store():
+    store = chroma_memory.ChromaMemoryStore.__new__(chroma_memory.ChromaMemoryStore)
+    store.collection_name = f"test_{uuid.uuid4().hex}"
+    store.client = chromadb.EphemeralClient()
+    store.embedding_model = _HashEncoder()
+    store.embedding_function = chroma_memory._EncoderEmbeddingFunction(store._encode)
+    store.collection = store._get_or_create_collection()
+    return store
+
+@pytest.mark.asyncio
+async def test_update_drops_removed_metadata(store):
+    item = MemoryItem(
+        id="fact-1",
+        content="Solar capacity grew in 2023.",
+        metadata={"source": "report", "confidence": 0.9},
+        timestamp=datetime.now(),
+        memory_type="fact"
+    )
+    assert await store.store(item)
+
+    updated = item.copy(update={"content": "Solar capacity grew again in 2024.", "metadata": {"source": "report"}})
+    assert await store.update(item.id, updated)
+
+    items = await store.get_items_by_type("fact")
+    assert len(items) == 1
+    assert items[0].content == "Solar capacity grew again in 2024."
+    assert "confidence" not in items[0].metadata
+    assert items[0].metadata["source"] == "report"
@@ -0,0 +1,37 @@
+"""
+Tests for the AG2 research workflow
+"""
+import pytest
+
+research_workflow = pytest.importorskip("athena_research.orchestration.workflows.research_workflow")
+
+def _adapt(cached_plan, topic):
+    workflow = research_workflow.AthenaResearchWorkflow.__new__(research_workflow.AthenaResearchWorkflow)
+    return workflow._adapt_plan_sections(cached_plan, topic)
+
+def test_adapt_plan_substitutes_topic_in_queries():
+    cached_plan = {
+        "topic": "solar power",
+        "sections": [{"title": "History of solar power", "queries": ["solar power history", "solar power 1950s"]}]
+    }
+
+    sections = _adapt(cached_plan, "wind power")
+
+    assert sections[0]["title"] == "History of wind power"
+    assert sections[0]["queries"] == ["wind power history", "wind power 1950s"]
+
+def test_adapt_plan_replaces_queries_without_old_topic():
+    cached_plan = {
+        "topic": "solar power",
+        "sections": [
+            {"title": "Market Outlook", "queries": ["photovoltaic market growth", "PV panel prices 2024"]},
+            {"title": "Policy", "queries": ["solar power subsidies", "feed-in tariffs"]}
+        ]
+    }
+
+    sections = _adapt(cached_plan, "wind power")
+
+    # None of the old queries name the topic, so none of them survive
+    assert sections[0]["title"] == "Market Outlook"
+    assert sections[0]["queries"] == ["wind power Market Outlook"]
+    assert sections[1]["queries"] == ["wind power subsidies"]